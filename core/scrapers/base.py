@@ -4,23 +4,129 @@ Base scraper class for web scraping operations.
 Provides common functionality for all scrapers.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+import asyncio
+from io import BytesIO
+from typing import Dict, Any, Optional, List, Set, Tuple
 import logging
 from pathlib import Path
+from urllib.parse import urlsplit
+
+import aiofiles
+import httpx
+from playwright.async_api import async_playwright
 
 logger = logging.getLogger(__name__)
 
+# Screenshot directories already created by this process
+_CREATED_DIRS: Set[Path] = set()
+
+# Characters that are unsafe in filenames, mapped to their replacement
+# (None deletes the character)
+_FILENAME_TRANS = str.maketrans({
+    '/': '-',
+    '\\': '-',
+    ':': '-',
+    '*': '-',
+    '?': '-',
+    '"': None,
+    '<': None,
+    '>': None,
+    '|': '-',
+    ' ': '_'
+})
+
+
+# Process-wide Playwright driver, shared by the browser, persistent contexts
+# and open scraper sessions; stopped when the last holder releases it
+_PW = None
+_PW_LOCK = asyncio.Lock()
+_PW_REFS = 0
+
+
+async def _get_playwright():
+    """Take a reference to the shared Playwright driver, starting it if needed."""
+    global _PW, _PW_REFS
+    async with _PW_LOCK:
+        if _PW is None:
+            _PW = await async_playwright().start()
+            logger.info("Started Playwright")
+        _PW_REFS += 1
+        return _PW
+
 
-class BaseScraper(ABC):
-    """Abstract base class for web scrapers."""
+async def _release_playwright() -> None:
+    """Drop a reference taken with _get_playwright(), stopping on the last one."""
+    global _PW, _PW_REFS
+    async with _PW_LOCK:
+        if _PW_REFS == 0:
+            return
+        _PW_REFS -= 1
+        if _PW_REFS == 0 and _PW is not None:
+            await _PW.stop()
+            _PW = None
+
+
+def _encode_webp(png_bytes: bytes, quality: int = 75) -> bytes:
+    """Re-encode a PNG screenshot as WebP (CPU-bound, run off the event loop)."""
+    from PIL import Image
+    
+    output = BytesIO()
+    Image.open(BytesIO(png_bytes)).save(output, "WEBP", quality=quality, method=4)
+    return output.getvalue()
+
+
+class BaseScraper:
+    """
+    Base class for web scrapers.
+    
+    Subclasses implement __aenter__, __aexit__ and submit_request.
+    
+    Instance attributes live in __slots__. Subclasses should declare their
+    own __slots__ (an empty tuple if they add no attributes) to keep the
+    memory savings; otherwise they silently get a __dict__ again.
+    """
+    
+    __slots__ = (
+        "name",
+        "logger",
+        "_screenshot_dir_raw",
+        "_screenshot_dir",
+        "_screenshot_dir_str",
+        "proxy_url",
+        "headless",
+        "timeout",
+        "browser",
+        "page",
+        "_http",
+        "_prefetch_task",
+        "_preconnect_task",
+    )
+    
+    # One Playwright browser shared by every scraper in the process;
+    # each scrape gets its own lightweight BrowserContext instead
+    _shared_browser = None
+    _browser_lock = asyncio.Lock()
+    
+    # Resource types aborted in every context - scrapers only need the
+    # HTML and forms, not the media
+    BLOCK_RESOURCE_TYPES: Set[str] = {"image", "media", "font"}
+    
+    # Third-party hosts (analytics, ads) aborted in every context
+    BLOCK_DOMAINS: Tuple[str, ...] = ()
+    
+    # Portal origins to warm up (DNS + TCP + TLS) when a scrape starts
+    PRECONNECT_ORIGINS: Tuple[str, ...] = ()
+    
+    # Screenshot encoding: "jpeg" or "webp" (smallest files, needs Pillow)
+    SCREENSHOT_FORMAT = "jpeg"
     
     def __init__(
         self,
         screenshot_dir: Optional[str] = None,
         proxy_url: Optional[str] = None,
         headless: bool = True,
-        timeout: int = 30000
+        timeout: int = 30000,
+        name: Optional[str] = None
     ):
         """
         Initialize base scraper.
@@ -30,33 +136,314 @@ class BaseScraper(ABC):
             proxy_url: Optional proxy URL
             headless: Run browser in headless mode
             timeout: Default timeout in milliseconds
+            name: Scraper name used in logs and evidence filenames
         """
-        self.screenshot_dir = Path(screenshot_dir) if screenshot_dir else None
+        self.name = name or type(self).__name__.lower()
+        self.logger = logging.getLogger(f"{__name__}.{self.name}")
+        self._screenshot_dir_raw = screenshot_dir
+        self._screenshot_dir: Optional[Path] = None
+        self._screenshot_dir_str: Optional[str] = None
         self.proxy_url = proxy_url
         self.headless = headless
         self.timeout = timeout
         self.browser = None
         self.page = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._preconnect_task: Optional[asyncio.Task] = None
+    
+    @property
+    def screenshot_dir(self) -> Optional[Path]:
+        """Screenshot directory, created on first access (once per process)."""
+        if self._screenshot_dir is None and self._screenshot_dir_raw:
+            path = Path(self._screenshot_dir_raw)
+            if path not in _CREATED_DIRS:
+                path.mkdir(parents=True, exist_ok=True)
+                _CREATED_DIRS.add(path)
+            self._screenshot_dir = path
+            self._screenshot_dir_str = str(path)
+            
+        return self._screenshot_dir
+    
+    @classmethod
+    async def get_shared_browser(cls, **launch_options):
+        """
+        Get the process-wide browser, launching it on first use.
         
-        # Create screenshot directory if specified
-        if self.screenshot_dir:
-            self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        Launch options only take effect on the first launch, so anything
+        that differs between scrapers (such as the proxy) belongs in the
+        per-context options instead.
+        
+        Args:
+            **launch_options: chromium.launch() options (first launch only)
+            
+        Returns:
+            Shared Playwright Browser instance
+        """
+        async with BaseScraper._browser_lock:
+            if BaseScraper._shared_browser is None:
+                playwright = await _get_playwright()
+                try:
+                    BaseScraper._shared_browser = await playwright.chromium.launch(
+                        **launch_options
+                    )
+                except Exception:
+                    await _release_playwright()
+                    raise
+                logger.info("Launched shared browser")
+                
+        return BaseScraper._shared_browser
+    
+    @classmethod
+    async def close_shared_browser(cls) -> None:
+        """Close the shared browser and release its Playwright reference (call on shutdown)."""
+        async with BaseScraper._browser_lock:
+            if BaseScraper._shared_browser is not None:
+                await BaseScraper._shared_browser.close()
+                BaseScraper._shared_browser = None
+                await _release_playwright()
+    
+    async def _acquire_context(self, user_data_dir: Optional[Path] = None):
+        """
+        Create a fresh BrowserContext on the shared browser.
+        
+        Subclasses call this from __aenter__ instead of launching their own
+        browser, and close the context (not the browser) in __aexit__.
+        
+        Args:
+            user_data_dir: Optional profile directory. When given, the context
+                is launched persistently so cookies and HTTP cache survive
+                restarts. It runs its own browser process and the directory
+                must not be shared with another live context.
+        """
+        if user_data_dir is None:
+            browser = await self.get_shared_browser(**self._browser_launch_options())
+            context = await browser.new_context(**self._context_options())
+        else:
+            playwright = await _get_playwright()
+            Path(user_data_dir).mkdir(parents=True, exist_ok=True)
+            try:
+                context = await playwright.chromium.launch_persistent_context(
+                    str(user_data_dir),
+                    **self._browser_launch_options(),
+                    **self._context_options()
+                )
+            except Exception:
+                await _release_playwright()
+                raise
+                
+            # The persistent context holds its Playwright reference until closed
+            context.on("close", lambda _: asyncio.ensure_future(_release_playwright()))
+        
+        if self.BLOCK_RESOURCE_TYPES or self.BLOCK_DOMAINS:
+            await context.route("**/*", self._route_blocking_resources)
+            
+        return context
+    
+    def _browser_launch_options(self) -> Dict[str, Any]:
+        """Options for launching the shared browser (override to customize)."""
+        return {"headless": self.headless}
+    
+    def _context_options(self) -> Dict[str, Any]:
+        """Options for each new BrowserContext (override to customize)."""
+        return self._proxy_options()
+    
+    def _proxy_options(self) -> Dict[str, Any]:
+        """Context options routing this scraper's traffic through proxy_url."""
+        if not self.proxy_url:
+            return {}
+        
+        # Playwright wants credentials apart from the server address
+        parsed = urlsplit(self.proxy_url)
+        server = f"{parsed.scheme}://{parsed.hostname}"
+        if parsed.port:
+            server += f":{parsed.port}"
+        return {
+            "proxy": {
+                "server": server,
+                "username": parsed.username,
+                "password": parsed.password
+            }
+        }
+    
+    @classmethod
+    async def _route_blocking_resources(cls, route) -> None:
+        """Abort blocked resource types and domains, let the rest through."""
+        request = route.request
+        if (request.resource_type in cls.BLOCK_RESOURCE_TYPES
+                or any(domain in request.url for domain in cls.BLOCK_DOMAINS)):
+            await route.abort()
+        else:
+            await route.continue_()
     
-    @abstractmethod
     async def __aenter__(self):
         """Async context manager entry."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def submit_request(self, *args, **kwargs) -> Dict[str, Any]:
         """Submit a request to the portal."""
+        raise NotImplementedError
+    
+    async def setup(self) -> None:
+        """Prepare the scraper before scraping (hook for subclasses)."""
         pass
     
+    async def handle_error(self, error: Exception, context: str) -> None:
+        """
+        Log a scraping error and capture the page state.
+        
+        Args:
+            error: The exception raised
+            context: Name of the step that failed
+        """
+        self.logger.error("Error in %s: %s", context, error)
+        await self.take_screenshot(f"error_{self.sanitize_filename(context)}")
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the scraper's HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                proxies=self.proxy_url,
+                timeout=self.timeout / 1000,
+                follow_redirects=True
+            )
+        return self._http
+    
+    def start_preconnect(self) -> None:
+        """
+        Warm connections to PRECONNECT_ORIGINS in the background.
+        
+        Subclasses call this at the start of __aenter__ so the handshakes
+        overlap with browser startup; it is never awaited.
+        """
+        if self.PRECONNECT_ORIGINS and self._preconnect_task is None:
+            self._preconnect_task = asyncio.create_task(self._preconnect())
+    
+    async def _preconnect(self) -> None:
+        """Send a HEAD request to each preconnect origin, ignoring failures."""
+        client = self._get_http()
+        await asyncio.gather(
+            *[client.head(origin) for origin in self.PRECONNECT_ORIGINS],
+            return_exceptions=True
+        )
+    
+    async def fetch_http(self, url: str, **kwargs) -> Tuple[int, Dict[str, str], str]:
+        """
+        Fetch a URL over plain HTTP, without a browser.
+        
+        Much cheaper than a Playwright navigation for endpoints that return
+        HTML or JSON without needing JavaScript. Subclasses should try this
+        first and fall back to self.page.goto() when
+        needs_js_rendering() says the response is only an app shell.
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Extra arguments passed to httpx.AsyncClient.get
+            
+        Returns:
+            Tuple of (status_code, headers, body_text)
+        """
+        response = await self._get_http().get(url, **kwargs)
+        return response.status_code, dict(response.headers), response.text
+    
+    @staticmethod
+    def needs_js_rendering(body: str) -> bool:
+        """
+        Guess whether an HTTP response is a JavaScript app shell.
+        
+        Args:
+            body: Response body from fetch_http
+            
+        Returns:
+            True if the page must be rendered in a browser
+        """
+        return len(body) < 2048 and "<script" in body.lower()
+    
+    async def close_http(self) -> None:
+        """Close the HTTP client used by fetch_http (call from __aexit__)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    def prefetch(self, url: str) -> None:
+        """
+        Start navigating to the next page in the background.
+        
+        Call right before heavy local work (e.g. parsing the current
+        response) so the network round trip overlaps with it, then call
+        await_prefetched() before reading from self.page again.
+        
+        Args:
+            url: URL of the next page
+        """
+        if not self.page:
+            return
+            
+        self._prefetch_task = asyncio.create_task(
+            self.page.goto(url, wait_until="commit")
+        )
+    
+    async def await_prefetched(self):
+        """
+        Wait for a navigation started by prefetch() to finish.
+        
+        Returns:
+            The navigation response, or None if nothing was prefetched
+        """
+        if self._prefetch_task is None:
+            return None
+            
+        task, self._prefetch_task = self._prefetch_task, None
+        return await task
+    
+    def clone(self) -> "BaseScraper":
+        """
+        Create a scraper with the same settings and its own page.
+        
+        Subclasses with extra constructor arguments override this to pass
+        them on.
+        """
+        return type(self)(
+            screenshot_dir=self._screenshot_dir_raw,
+            proxy_url=self.proxy_url,
+            headless=self.headless,
+            timeout=self.timeout
+        )
+    
+    async def submit_requests(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 5
+    ) -> List[Any]:
+        """
+        Submit several requests concurrently.
+        
+        Each item runs on its own scraper from clone(), since concurrent
+        form fills on one page would corrupt each other.
+        
+        Args:
+            items: Keyword arguments for each submit_request call
+            max_concurrency: Maximum number of submissions in flight
+            
+        Returns:
+            Results in the same order as items; failed submissions are
+            returned as their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _submit_one(item: Dict[str, Any]):
+            async with semaphore:
+                return await self.clone().submit_request(**item)
+                
+        return await asyncio.gather(
+            *[_submit_one(item) for item in items],
+            return_exceptions=True
+        )
+    
     async def take_screenshot(self, name: str) -> Optional[str]:
         """
         Take a screenshot and save it.
@@ -67,45 +454,52 @@ class BaseScraper(ABC):
         Returns:
             Path to saved screenshot or None
         """
-        if not self.page or not self.screenshot_dir:
+        if not self.page or not self._screenshot_dir_raw:
             return None
             
         try:
-            screenshot_path = self.screenshot_dir / f"{name}.png"
-            await self.page.screenshot(path=str(screenshot_path))
-            logger.info(f"Saved screenshot: {screenshot_path}")
-            return str(screenshot_path)
+            # Plain string join; the directory string is cached on first use
+            screenshot_dir = self._screenshot_dir_str or str(self.screenshot_dir)
+            
+            # Capture as bytes and write the file without blocking the event
+            # loop; JPEG is much cheaper to encode than PNG
+            if self.SCREENSHOT_FORMAT == "webp":
+                screenshot_path = f"{screenshot_dir}/{name}.webp"
+                data = await self.page.screenshot(type="png")
+                data = await asyncio.to_thread(_encode_webp, data)
+            else:
+                screenshot_path = f"{screenshot_dir}/{name}.jpg"
+                data = await self.page.screenshot(type="jpeg", quality=70)
+                
+            async with aiofiles.open(screenshot_path, "wb") as f:
+                await f.write(data)
+                
+            logger.info("Saved screenshot: %s", screenshot_path)
+            return screenshot_path
         except Exception as e:
-            logger.error(f"Failed to take screenshot: {e}")
+            logger.error("Failed to take screenshot: %s", e)
             return None
     
-    def sanitize_filename(self, text: str) -> str:
+    @staticmethod
+    def sanitize_filename(text: str) -> str:
         """
         Sanitize text for use in filenames.
         
         Args:
-            text: Text to sanitize
+            text: Text to sanitize (None yields an empty string)
             
         Returns:
-            Sanitized filename
-        """
-        # Replace problematic characters
-        replacements = {
-            '/': '-',
-            '\\': '-',
-            ':': '-',
-            '*': '-',
-            '?': '-',
-            '"': '',
-            '<': '',
-            '>': '',
-            '|': '-',
-            ' ': '_'
-        }
+            Sanitized filename, at most 100 characters
+        """
+        if not text:
+            return ""
+            
+        # Every mapping is one-to-one or a deletion, so only the first 100
+        # characters can end up in the result; sanitize just that prefix
+        result = text[:100].translate(_FILENAME_TRANS)
         
-        result = text
-        for old, new in replacements.items():
-            result = result.replace(old, new)
+        # Deleted characters shortened the prefix - fall back to the full text
+        if len(result) < 100 and len(text) > 100:
+            result = text.translate(_FILENAME_TRANS)[:100]
             
-        # Limit length
-        return result[:100]
\ No newline at end of file
+        return result
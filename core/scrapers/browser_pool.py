@@ -0,0 +1,130 @@
+"""
+Warm pool of Playwright browser contexts.
+
+Keeps a bounded number of BrowserContexts alive between scrapes and
+recycles each one after a fixed number of uses, so cookies and cache
+accumulated over thousands of submissions don't grow without bound.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Builds a new context for the given pool slot
+ContextFactory = Callable[[int], Awaitable[Any]]
+
+
+class BrowserContextPool:
+    """
+    Bounded pool of reusable BrowserContexts.
+    
+    Contexts are created lazily, at most pool_size at a time; further
+    callers wait for one to be released. The most recently released
+    context is handed out first, so the pool only grows under concurrency.
+    """
+    
+    def __init__(self, pool_size: Optional[int] = None, max_uses: Optional[int] = None):
+        """
+        Initialize the pool.
+        
+        Args:
+            pool_size: Maximum live contexts (default: POOL_SIZE env var or 3)
+            max_uses: Uses before a context is recycled
+                (default: MAX_USES_PER_CONTEXT env var or 50)
+        """
+        self.pool_size = pool_size or int(os.getenv("POOL_SIZE", "3"))
+        self.max_uses = max_uses or int(os.getenv("MAX_USES_PER_CONTEXT", "50"))
+        
+        # Holds idle contexts and the ids of slots with no context yet
+        self._idle: Optional[asyncio.LifoQueue] = None
+        # context -> [slot, uses]
+        self._leases: Dict[Any, list] = {}
+    
+    def _queue(self) -> asyncio.LifoQueue:
+        """Create the slot queue on first use, inside the running loop."""
+        if self._idle is None:
+            self._idle = asyncio.LifoQueue()
+            for slot in reversed(range(self.pool_size)):
+                self._idle.put_nowait(slot)
+        return self._idle
+    
+    async def get(self, factory: ContextFactory):
+        """
+        Take a context from the pool, creating one if a slot is free.
+        
+        Args:
+            factory: Coroutine function building a context for a slot
+        
+        Returns:
+            BrowserContext
+        """
+        queue = self._queue()
+        item = await queue.get()
+        if not isinstance(item, int):
+            return item
+        
+        try:
+            context = await factory(item)
+        except Exception:
+            queue.put_nowait(item)
+            raise
+        
+        self._leases[context] = [item, 0]
+        return context
+    
+    async def release(self, context, dirty: bool = False) -> None:
+        """
+        Return a context to the pool.
+        
+        Args:
+            context: Context obtained from get()
+            dirty: Discard the context instead of reusing it (e.g. after a
+                page-level failure)
+        """
+        lease = self._leases.get(context)
+        if lease is None:
+            return
+        
+        lease[1] += 1
+        if not dirty and lease[1] < self.max_uses:
+            self._queue().put_nowait(context)
+            return
+        
+        # Recycle: close the context and free its slot for a fresh one
+        del self._leases[context]
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing recycled context: {e}")
+        self._queue().put_nowait(lease[0])
+    
+    @asynccontextmanager
+    async def acquire(self, factory: ContextFactory):
+        """
+        Borrow a context for the duration of a block.
+        
+        The context is discarded rather than reused if the block raises.
+        """
+        context = await self.get(factory)
+        try:
+            yield context
+        except Exception:
+            await self.release(context, dirty=True)
+            raise
+        else:
+            await self.release(context)
+    
+    async def close(self) -> None:
+        """Close every context, idle or leased, and reset the pool."""
+        for context in list(self._leases):
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled context: {e}")
+        
+        self._leases.clear()
+        self._idle = None
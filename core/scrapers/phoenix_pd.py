@@ -15,22 +15,68 @@ Supports all report types:
 """
 
 import asyncio
+import functools
+import hashlib
+import itertools
+import logging
+import os
 import random
-from typing import Dict, Any, Optional, Literal
+import time
+from typing import Dict, Any, List, Optional, Literal, Set, Tuple
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 import re
 import json
+import tempfile
+from urllib.parse import parse_qsl, urlsplit
 
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+import aiofiles
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from .base import BaseScraper
-from ..utils.delays import human_delay, get_typing_delay, random_micro_delay
+from .base import BaseScraper, _get_playwright, _release_playwright
+from .browser_pool import BrowserContextPool
+from ..utils.network_cache import NetworkCache
+from ..utils.delays import HumanDelayProfile, get_typing_delay
 from ..utils.sanitize import (
     sanitize_phoenix_input, sanitize_case_number, 
     prepare_phoenix_submission, validate_report_type_restrictions
 )
 
+logger = logging.getLogger(__name__)
+
+# Evidence screenshot sequence number, shared by every scraper in the process
+_SCREENSHOT_SEQ = itertools.count()
+
+
+def _build_report_selectors(configs, templates) -> Dict[str, Tuple[str, ...]]:
+    """Format the report selector templates for every report type."""
+    return {
+        report_type: tuple(
+            template.format(form_value=config["form_value"], report_name=config["name"])
+            for template in templates
+        )
+        for report_type, config in configs.items()
+    }
+
+
+class RetryableResponse(Exception):
+    """Portal response worth retrying, e.g. 429 or 5xx."""
+    
+    def __init__(self, status: int, retry_after: Optional[str] = None):
+        super().__init__(f"Portal returned status {status}")
+        self.status = status
+        # Only the delta-seconds form of Retry-After is honoured
+        self.retry_after = float(retry_after) if retry_after and retry_after.isdigit() else None
+
+
+class NonRetryableResponse(Exception):
+    """Portal response that will not change on retry, e.g. 404."""
+    
+    def __init__(self, status: int):
+        super().__init__(f"Portal returned status {status}")
+        self.status = status
+
 
 class PhoenixPDScraper(BaseScraper):
     """
@@ -45,240 +91,658 @@ class PhoenixPDScraper(BaseScraper):
     - Input sanitization for Phoenix PD's fragile system
     """
     
-    # Report type configurations
-    REPORT_CONFIGS = {
-        "incident": {
+    __slots__ = (
+        "stealth_level",
+        "portal_url",
+        "delay",
+        "evidence_dir",
+        "_context",
+        "_context_dirty",
+        "_pw",
+        "_screenshots",
+        "_pending_writes",
+        "always_save",
+        "_evidence_buffer",
+        "_filled_values",
+        "_captured_posts",
+        "_hidden_fields",
+    )
+    
+    # Report type configurations, frozen so tasks sharing the class cannot
+    # mutate a config
+    REPORT_CONFIGS = MappingProxyType({
+        "incident": MappingProxyType({
             "name": "Incident Report",
             "form_value": "incident_report",
             "base_fee": 5.00,
-            "fields": ["case_number", "requestor_info"]
-        },
-        "traffic_crash": {
+            "fields": ("case_number", "requestor_info")
+        }),
+        "traffic_crash": MappingProxyType({
             "name": "Traffic Crash", 
             "form_value": "traffic_crash",
             "base_fee": 5.00,
-            "fields": ["case_number", "requestor_info"]
-        },
-        "body_camera": {
+            "fields": ("case_number", "requestor_info")
+        }),
+        "body_camera": MappingProxyType({
             "name": "On Body Camera Audio/Video",
             "form_value": "body_camera",
             "base_fee": 4.00,
-            "fields": ["case_number", "requestor_info", "officer_badge", "incident_date", "time_range"]
-        },
-        "surveillance": {
+            "fields": ("case_number", "requestor_info", "officer_badge", "incident_date", "time_range")
+        }),
+        "surveillance": MappingProxyType({
             "name": "Surveillance Videos",
             "form_value": "surveillance_video",
             "base_fee": 4.00,
-            "fields": ["case_number", "requestor_info", "location", "incident_date"]
-        },
-        "recordings_911": {
+            "fields": ("case_number", "requestor_info", "location", "incident_date")
+        }),
+        "recordings_911": MappingProxyType({
             "name": "911 Recordings",
             "form_value": "911_recording",
             "base_fee": 16.50,
-            "fields": ["case_number", "requestor_info", "incident_date"],
+            "fields": ("case_number", "requestor_info", "incident_date"),
             "max_age_days": 190
-        },
-        "calls_for_service": {
+        }),
+        "calls_for_service": MappingProxyType({
             "name": "Calls for Service",
             "form_value": "calls_for_service",
             "base_fee": 0.00,
-            "fields": ["address", "date_range", "requestor_info"]
-        },
-        "crime_statistics": {
+            "fields": ("address", "date_range", "requestor_info")
+        }),
+        "crime_statistics": MappingProxyType({
             "name": "Crime Statistics",
             "form_value": "crime_statistics", 
             "base_fee": 0.00,
-            "fields": ["area", "date_range", "requestor_info"]
-        }
+            "fields": ("area", "date_range", "requestor_info")
+        })
+    })
+    
+    # Link patterns for finding the records request form
+    LINK_PATTERNS = (
+        "text=/records request/i",
+        "text=/public records/i",
+        "text=/request.*report/i",
+        "text=/police report/i",
+        "a[href*='records']",
+        "a[href*='request']",
+        "button:has-text('Request')",
+        "button:has-text('Records')"
+    )
+    
+    # Report type selectors, formatted with form_value/report_name
+    REPORT_SELECTOR_TEMPLATES = (
+        "input[type='radio'][value*='{form_value}']",
+        "input[type='checkbox'][value*='{form_value}']",
+        "label:has-text('{report_name}')",
+        "button:has-text('{report_name}')",
+        "div:has-text('{report_name}')",
+        "option:has-text('{report_name}')"
+    )
+    
+    # Per-type lookups precomputed once at class creation
+    _FIELDS_BY_TYPE = {
+        report_type: frozenset(config["fields"]) for report_type, config in REPORT_CONFIGS.items()
+    }
+    _SELECTORS_BY_TYPE = _build_report_selectors(REPORT_CONFIGS, REPORT_SELECTOR_TEMPLATES)
+    
+    # Common input field patterns
+    FIELD_MAPPINGS = {
+        "case_number": (
+            "input[name*='case']",
+            "input[name*='report']",
+            "input[name*='number']",
+            "input[id*='case']",
+            "input[placeholder*='case']",
+            "input[placeholder*='report']"
+        ),
+        "first_name": (
+            "input[name*='first']",
+            "input[name*='fname']",
+            "input[id*='first']",
+            "input[placeholder*='first']"
+        ),
+        "last_name": (
+            "input[name*='last']",
+            "input[name*='lname']",
+            "input[id*='last']",
+            "input[placeholder*='last']"
+        ),
+        "email": (
+            "input[type='email']",
+            "input[name*='email']",
+            "input[id*='email']",
+            "input[placeholder*='email']"
+        ),
+        "phone": (
+            "input[type='tel']",
+            "input[name*='phone']",
+            "input[id*='phone']",
+            "input[placeholder*='phone']"
+        ),
+        "address": (
+            "input[name*='address']",
+            "input[id*='address']",
+            "input[placeholder*='address']",
+            "textarea[name*='address']"
+        ),
+        "date": (
+            "input[type='date']",
+            "input[name*='date']",
+            "input[id*='date']",
+            "input[placeholder*='date']"
+        ),
+        "officer_badge": (
+            "input[name*='officer']",
+            "input[name*='badge']",
+            "input[id*='officer']",
+            "input[placeholder*='officer']"
+        )
+    }
+    
+    # Common submit button patterns
+    SUBMIT_PATTERNS = (
+        "button[type='submit']",
+        "input[type='submit']",
+        "button:has-text('Submit')",
+        "button:has-text('Send')",
+        "button:has-text('Request')",
+        "button:has-text('Continue')",
+        "input[value*='Submit']"
+    )
+    
+    # Confirmation number patterns, in priority order
+    CONFIRMATION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        r"Confirmation\s*#?:?\s*([A-Z0-9-]+)",
+        r"Reference\s*#?:?\s*([A-Z0-9-]+)",
+        r"Request\s*ID\s*:?\s*([A-Z0-9-]+)",
+        r"Tracking\s*#?:?\s*([A-Z0-9-]+)",
+        r"Ticket\s*#?:?\s*([A-Z0-9-]+)",
+        r"Case\s*#?:?\s*([A-Z0-9-]+)"
+    ))
+    
+    # Phrases that mark a successful submission
+    SUCCESS_INDICATORS = (
+        "success",
+        "received",
+        "submitted",
+        "thank you",
+        "confirmation",
+        "complete"
+    )
+    SUCCESS_TEXT = re.compile("|".join(SUCCESS_INDICATORS), re.IGNORECASE)
+    
+    # Request errors raised before anything was sent, so the portal never
+    # saw the submission and the browser flow can safely take over
+    UNSENT_ERRORS = re.compile(
+        r"ECONNREFUSED|ENOTFOUND|EAI_AGAIN|ERR_CONNECTION_REFUSED|ERR_NAME_NOT_RESOLVED"
+    )
+    
+    # Longest page text attached to confirmations in DEBUG mode
+    FULL_TEXT_LIMIT = 8192
+    
+    # Analytics and ad hosts the portal pulls in; never needed for scraping.
+    # Stylesheets stay loaded because visibility checks depend on them.
+    BLOCK_DOMAINS = (
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "facebook.net",
+        "hotjar.com",
+        "segment.io",
+    )
+    
+    # Static portal assets served from disk between submissions. Documents
+    # are never cached: the form pages carry per-session tokens.
+    CACHE_HOSTS = ("phxpublicsafety.phoenix.gov",)
+    CACHE_RESOURCE_TYPES = {"script", "stylesheet"}
+    _network_cache = NetworkCache(Path(".network-cache"), ttl=3600)
+    
+    # Browser contexts kept warm across submissions, shared per process.
+    # Contexts carry their creator's init script and proxy, so there is one
+    # pool per (stealth level, proxy URL), each sized by POOL_SIZE /
+    # MAX_USES_PER_CONTEXT.
+    _context_pools: Dict[Tuple[str, Optional[str]], BrowserContextPool] = {}
+    
+    # Stealth configuration applied to every pooled context
+    STEALTH_INIT_SCRIPT = """
+        // Override webdriver detection
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        });
+        
+        // Mock plugins
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => [1, 2, 3, 4, 5]
+        });
+        
+        // Mock languages
+        Object.defineProperty(navigator, 'languages', {
+            get: () => ['en-US', 'en']
+        });
+        
+        // Override permissions
+        const originalQuery = window.navigator.permissions.query;
+        window.navigator.permissions.query = (parameters) => (
+            parameters.name === 'notifications' ?
+                Promise.resolve({ state: Notification.permission }) :
+                originalQuery(parameters)
+        );
+    """
+    
+    EXTRA_HTTP_HEADERS = {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1"
     }
     
-    def __init__(self, **kwargs):
-        """Initialize Phoenix PD scraper."""
+    # Chromium flags for the shared browser. Software-rendering flags
+    # (--disable-gpu, --disable-accelerated-2d-canvas) are left out: they
+    # only slow rendering down. --no-sandbox is not needed either, since
+    # Playwright launches Chromium without its sandbox by default. The
+    # background flags keep idle pooled pages from burning CPU.
+    STEALTH_ARGS = (
+        "--disable-blink-features=AutomationControlled",
+        "--disable-features=IsolateOrigins,site-per-process",
+        "--disable-site-isolation-trials",
+        "--disable-dev-shm-usage",
+        "--disable-background-networking",
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--no-first-run",
+        "--mute-audio",
+    )
+    
+    # POST keys that look like per-session tokens; never replayed from a spec
+    SESSION_TOKEN_KEYS = re.compile(
+        r"token|csrf|xsrf|nonce|verification|captcha|session|viewstate|eventvalidation",
+        re.IGNORECASE
+    )
+    
+    # Backing POST endpoint learned from a successful browser submission,
+    # kept with the evidence since the package directory may be read-only
+    API_SPEC_PATH = Path("evidence") / "phoenix_pd_api.json"
+    _api_spec: Optional[Dict[str, Any]] = None
+    
+    # Field selectors known to work, per portal host (loaded from and
+    # saved to evidence/selectors.json)
+    _selector_cache: Optional[Dict[str, Dict[str, str]]] = None
+    
+    # Evidence directories already created by this process
+    _ready_evidence_dirs: Set[Path] = set()
+    
+    def __init__(self, stealth_level: str = "normal", always_save: bool = False, **kwargs):
+        """
+        Initialize Phoenix PD scraper.
+        
+        Args:
+            stealth_level: "normal", "paranoid" to type form input key by key,
+                or "off" to skip the stealth init script and every human
+                delay (e.g. for test runs or portals that don't fingerprint)
+            always_save: Write every step's screenshot, not just on failure
+            **kwargs: Passed to BaseScraper
+        """
         super().__init__(name="phoenix_pd", **kwargs)
+        self.stealth_level = stealth_level
         self.portal_url = "https://phxpublicsafety.phoenix.gov/"
+        self.delay = HumanDelayProfile(
+            "off" if stealth_level == "off"
+            else os.environ.get("PHOENIX_DELAY_PROFILE", "moderate")
+        )
+        # Created on first write, not per instance
         self.evidence_dir = Path("evidence")
-        self.evidence_dir.mkdir(exist_ok=True)
+        self._context = None
+        self._context_dirty = False
+        self._pw = None
+        # Screenshots taken during the current submission
+        self._screenshots: List[str] = []
+        # Evidence files still being written in the background
+        self._pending_writes: Set[asyncio.Task] = set()
+        # Intermediate screenshots held until we know the submission failed
+        self.always_save = always_save
+        self._evidence_buffer: List[Tuple[Path, bytes]] = []
+        # Values filled into the form and POSTs seen on submit, used to
+        # learn the portal's submission endpoint
+        self._filled_values: Dict[str, str] = {}
+        self._captured_posts: List[Any] = []
+        self._hidden_fields: Set[str] = set()
         
-    async def setup(self):
-        """Setup browser with stealth configuration."""
-        await super().setup()
+    async def __aenter__(self):
+        """Open a page on a pooled browser context."""
+        await self.setup()
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Return the browser context to the pool."""
+        await self.close()
         
-        playwright = await async_playwright().start()
+    def clone(self) -> "PhoenixPDScraper":
+        """Create a scraper with the same settings and its own page."""
+        return type(self)(
+            stealth_level=self.stealth_level,
+            always_save=self.always_save,
+            screenshot_dir=self._screenshot_dir_raw,
+            proxy_url=self.proxy_url,
+            headless=self.headless,
+            timeout=self.timeout
+        )
         
-        # Stealth browser configuration
-        launch_options = {
+    def _browser_launch_options(self) -> Dict[str, Any]:
+        """Stealth browser configuration for the shared browser."""
+        return {
             "headless": self.headless,
-            "args": [
-                "--disable-blink-features=AutomationControlled",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-site-isolation-trials",
-                "--disable-web-security",
-                "--disable-features=IsolateOrigins",
-                "--disable-site-isolation-trials",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-accelerated-2d-canvas",
-                "--no-first-run",
-                "--no-zygote",
-                "--disable-gpu",
-                "--hide-scrollbars",
-                "--mute-audio",
-            ]
+            "args": list(self.STEALTH_ARGS)
         }
         
-        # Add proxy if configured
-        if self.proxy_url:
-            # Parse proxy URL for authentication
-            import urllib.parse
-            parsed = urllib.parse.urlparse(self.proxy_url)
-            launch_options["proxy"] = {
-                "server": f"{parsed.scheme}://{parsed.hostname}:{parsed.port}",
-                "username": parsed.username,
-                "password": parsed.password
-            }
+    def _context_options(self) -> Dict[str, Any]:
+        """Realistic browser context settings, plus this scraper's proxy."""
+        return {
+            **self._proxy_options(),
+            "viewport": {"width": 1920, "height": 1080},
+            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+            "locale": "en-US",
+            "timezone_id": "America/Phoenix",
+            "permissions": ["geolocation"],
+            "geolocation": {"latitude": 33.4484, "longitude": -112.0740},  # Phoenix coordinates
+        }
+        
+    @property
+    def _context_pool(self) -> BrowserContextPool:
+        """Pool of contexts configured like this scraper."""
+        key = (self.stealth_level, self.proxy_url)
+        pool = self._context_pools.get(key)
+        if pool is None:
+            pool = self._context_pools[key] = BrowserContextPool()
+        return pool
+        
+    async def acquire_context(self):
+        """
+        Take a warmed browser context from the pool.
+        
+        Contexts are created lazily up to the pool size; after that callers
+        wait for one to be released.
+        """
+        return await self._context_pool.get(self._create_context)
+        
+    async def _create_context(self, slot: int):
+        """
+        Create a stealth-configured context for a pool slot.
+        
+        Each slot can keep its own on-disk profile (see PHOENIX_PROFILE_DIR).
+        """
+        # PHOENIX_PROFILE_DIR opts into persistent per-slot profiles so
+        # cookies and cached portal assets carry over between runs
+        profile_root = os.environ.get("PHOENIX_PROFILE_DIR")
+        user_data_dir = None
+        if profile_root:
+            # Slots are numbered per pool, so keep each pool's profiles apart
+            # (hashing the proxy keeps its credentials out of the path)
+            pool_dir = self.stealth_level
+            if self.proxy_url:
+                pool_dir += "-" + hashlib.blake2b(self.proxy_url.encode(), digest_size=6).hexdigest()
+            user_data_dir = Path(profile_root) / self.name / pool_dir / str(slot)
+        
+        context = await self._acquire_context(user_data_dir=user_data_dir)
+        try:
+            if self.stealth_level != "off":
+                await context.add_init_script(self.STEALTH_INIT_SCRIPT)
+            await context.set_extra_http_headers(self.EXTRA_HTTP_HEADERS)
+            await context.route("**/*", self._cache_route)
+        except Exception:
+            await context.close()
+            raise
             
-        self.browser = await playwright.chromium.launch(**launch_options)
+        return context
         
-        # Create browser context with realistic settings
-        context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            locale="en-US",
-            timezone_id="America/Phoenix",
-            permissions=["geolocation"],
-            geolocation={"latitude": 33.4484, "longitude": -112.0740},  # Phoenix coordinates
-        )
+    @classmethod
+    async def _cache_route(cls, route) -> None:
+        """
+        Serve cacheable portal assets from disk, fetching them on a miss.
         
-        self.page = await context.new_page()
-        
-        # Add stealth scripts
-        await self.page.add_init_script("""
-            // Override webdriver detection
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Mock plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            
-            // Mock languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            
-            // Override permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-        """)
-        
-        # Set extra headers
-        await self.page.set_extra_http_headers({
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1"
-        })
+        A classmethod, since the route outlives the scraper that created the
+        context and serves every scraper that later borrows it.
+        """
+        request = route.request
+        if (request.method != "GET"
+                or request.resource_type not in cls.CACHE_RESOURCE_TYPES
+                or urlsplit(request.url).hostname not in cls.CACHE_HOSTS):
+            # Hand over to the resource-blocking route
+            await route.fallback()
+            return
+            
+        cached = await cls._network_cache.get(request.url)
+        if cached:
+            status, headers, body = cached
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+            
+        response = await route.fetch()
+        body = await response.body()
+        if response.ok:
+            try:
+                await cls._network_cache.put(request.url, response.status, response.headers, body)
+            except OSError as e:
+                # Never leave the page waiting on an unfulfilled route
+                logger.warning(f"Could not cache {request.url}: {e}")
+        await route.fulfill(response=response, body=body)
         
-    async def navigate_to_portal(self):
-        """Navigate to the Phoenix PD portal with human-like behavior."""
-        max_retries = 3
+    async def release_context(self, context, dirty: bool = False) -> None:
+        """Put a browser context back into the pool, or recycle it if dirty."""
+        await self._context_pool.release(context, dirty=dirty)
+        
+    @classmethod
+    async def close_pool(cls) -> None:
+        """Close every pooled context and the shared browser (call on shutdown)."""
+        for pool in cls._context_pools.values():
+            await pool.close()
+        cls._context_pools.clear()
+        await cls.close_shared_browser()
+        
+    async def setup(self):
+        """Open a fresh page on a pooled, stealth-configured context."""
+        await super().setup()
+        
+        if self.page:
+            return
+            
+        # Keep the shared Playwright driver alive while this session is open
+        self._pw = await _get_playwright()
+        try:
+            self._context = await self.acquire_context()
+            self.page = await self._context.new_page()
+        except Exception:
+            await self.close()
+            raise
+        
+    async def close(self):
+        """Close the page and return its context to the pool."""
+        if self.page:
+            await self.page.close()
+            self.page = None
+            
+        if self._context:
+            await self.release_context(self._context, dirty=self._context_dirty)
+            self._context = None
+            self._context_dirty = False
+            
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+            
+        if self._pw is not None:
+            self._pw = None
+            await _release_playwright()
         
-        for attempt in range(max_retries):
+    async def _retry(self, coro_factory, *, attempts: int = 3, base: float = 1.0, cap: float = 30.0):
+        """
+        Await a coroutine, retrying failures with exponential backoff and jitter.
+        
+        A RetryableResponse carrying Retry-After is honoured instead of the
+        computed backoff. A NonRetryableResponse is re-raised immediately.
+        
+        Args:
+            coro_factory: Callable returning a fresh coroutine per attempt
+            attempts: Maximum number of attempts
+            base: Backoff before the first retry in seconds
+            cap: Longest backoff in seconds
+            
+        Returns:
+            Result of the first successful attempt
+        """
+        for attempt in range(attempts):
             try:
-                self.logger.info(f"Navigating to Phoenix PD portal (attempt {attempt + 1})")
-                
-                # Human-like delay before navigation
-                await human_delay(2.0, 4.0)
-                
-                # Navigate to the portal
-                response = await self.page.goto(
-                    self.portal_url,
-                    wait_until="networkidle",
-                    timeout=60000
-                )
-                
-                if response.status != 200:
-                    self.logger.warning(f"Got status {response.status}")
-                
-                # Wait for page to stabilize
-                await self.page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(random.uniform(1.5, 2.5))
-                
-                # Take screenshot of landing page
-                screenshot_path = await self.take_evidence_screenshot("landing_page")
+                return await coro_factory()
                 
-                # Verify we're on the right page
-                title = await self.page.title()
-                if "phoenix" in title.lower() or "public safety" in title.lower():
-                    self.logger.info("Successfully loaded Phoenix PD portal")
-                    return True
-                    
-            except PlaywrightTimeout:
-                self.logger.warning(f"Navigation timeout on attempt {attempt + 1}")
+            except NonRetryableResponse:
+                raise
                 
             except Exception as e:
-                await self.handle_error(e, "navigate_to_portal")
-                
-            if attempt < max_retries - 1:
-                await asyncio.sleep(5)
+                if attempt == attempts - 1:
+                    raise
+                    
+                wait = getattr(e, "retry_after", None)
+                if wait is None:
+                    wait = min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+                else:
+                    wait = min(cap, wait)
+                    
+                self.logger.warning(f"Attempt {attempt + 1} failed ({e!r}), retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
                 
+    async def _navigate_once(self) -> bool:
+        """Load the portal landing page, raising on retryable failures."""
+        # Human-like delay before navigation
+        await self.delay.delay(2.0, 4.0)
+        
+        # Trackers and long-polling keep the portal from ever going
+        # network-idle, so wait for the DOM and then for the links
+        # the next step needs
+        response = await self.page.goto(
+            self.portal_url,
+            wait_until="domcontentloaded",
+            timeout=20000
+        )
+        
+        if response.status == 429 or response.status >= 500:
+            raise RetryableResponse(response.status, response.headers.get("retry-after"))
+        if response.status >= 400:
+            raise NonRetryableResponse(response.status)
+        if response.status != 200:
+            self.logger.warning(f"Got status {response.status}")
+            
+        await self._wait_for_any(self.LINK_PATTERNS, timeout=15000)
+        await self.delay.delay(1.5, 2.5)
+        
+        # Take screenshot of landing page
+        await self.schedule_evidence_screenshot("landing_page")
+        
+        # Verify we're on the right page
+        title = (await self.page.title()).lower()
+        if "phoenix" not in title and "public safety" not in title:
+            raise RetryableResponse(response.status)
+            
+        self.logger.info("Successfully loaded Phoenix PD portal")
+        return True
+        
+    async def navigate_to_portal(self):
+        """Navigate to the Phoenix PD portal with human-like behavior."""
+        self.logger.info("Navigating to Phoenix PD portal")
+        
+        try:
+            return await self._retry(self._navigate_once, attempts=3, base=2.0)
+            
+        except PlaywrightTimeout:
+            self.logger.warning("Navigation timed out on every attempt")
+            
+        except Exception as e:
+            await self.handle_error(e, "navigate_to_portal")
+            
         return False
         
+    async def _wait_for_any(self, patterns, timeout: int):
+        """
+        Wait once for any of several selectors to become visible.
+        
+        All patterns share a single timeout budget instead of each waiting
+        in turn. Once something is visible, the first pattern in priority
+        order that matches a visible element wins.
+        
+        Args:
+            patterns: Selectors in priority order
+            timeout: Timeout in milliseconds for the combined wait
+            
+        Returns:
+            Tuple of (pattern, locator), or (None, None) if nothing appeared
+        """
+        combined = self.page.locator(patterns[0])
+        for pattern in patterns[1:]:
+            combined = combined.or_(self.page.locator(pattern))
+            
+        try:
+            await combined.first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeout:
+            return None, None
+            
+        for pattern in patterns:
+            locator = self.page.locator(pattern).first
+            if await locator.is_visible():
+                return pattern, locator
+                
+        return None, None
+        
+    async def _safe_click(self, target, timeout: int = 3000) -> bool:
+        """
+        Click a selector or locator, relying on Playwright's auto-wait.
+        
+        Args:
+            target: CSS selector or Locator
+            timeout: Timeout in milliseconds for the element to be clickable
+            
+        Returns:
+            True if clicked, False if it never became clickable in time
+        """
+        locator = self.page.locator(target).first if isinstance(target, str) else target
+        try:
+            await locator.click(timeout=timeout)
+            return True
+        except PlaywrightTimeout:
+            return False
+            
     async def find_request_form(self):
         """Locate and navigate to the records request form."""
         self.logger.info("Looking for records request form")
         
-        # Common patterns for finding the request form
-        link_patterns = [
-            "text=/records request/i",
-            "text=/public records/i",
-            "text=/request.*report/i",
-            "text=/police report/i",
-            "a[href*='records']",
-            "a[href*='request']",
-            "button:has-text('Request')",
-            "button:has-text('Records')"
-        ]
-        
-        for pattern in link_patterns:
+        pattern, element = await self._wait_for_any(self.LINK_PATTERNS, timeout=5000)
+        if element:
             try:
-                element = await self.page.wait_for_selector(pattern, timeout=5000)
-                if element:
-                    self.logger.info(f"Found request link with pattern: {pattern}")
-                    
-                    # Human-like hover before click
-                    await element.hover()
-                    await random_micro_delay()
-                    
-                    # Click the link
-                    await element.click()
-                    
-                    # Wait for navigation
-                    await self.page.wait_for_load_state("networkidle")
-                    await human_delay(2.0, 3.0)
-                    
-                    # Take screenshot
-                    await self.take_evidence_screenshot("request_form_page")
-                    
-                    return True
+                self.logger.info(f"Found request link with pattern: {pattern}")
+                
+                # Human-like hover before click
+                await element.hover()
+                await self.delay.micro_delay()
+                
+                # Click the link
+                if not await self._safe_click(element):
+                    raise PlaywrightTimeout("Request form link not clickable")
                     
+                # Wait for the form rather than for the network to go idle
+                await self.page.wait_for_load_state("domcontentloaded")
+                await self.page.locator("form").first.wait_for(state="attached", timeout=15000)
+                await self.delay.delay(2.0, 3.0)
+                
+                # Take screenshot
+                await self.schedule_evidence_screenshot("request_form_page")
+                
+                return True
+                
             except PlaywrightTimeout:
-                continue
+                self.logger.warning("Timed out following the request form link")
                 
         # If no direct link, look for forms on the page
-        forms = await self.page.query_selector_all("form")
-        self.logger.info(f"Found {len(forms)} forms on page")
+        form_count = await self.page.locator("form").count()
+        self.logger.info(f"Found {form_count} forms on page")
         
-        return len(forms) > 0
+        return form_count > 0
         
     async def select_report_type(self, report_type: str) -> bool:
         """Select the specific report type from available options."""
@@ -292,50 +756,158 @@ class PhoenixPDScraper(BaseScraper):
         report_name = config["name"]
         
         # Look for report type selection (radio buttons, checkboxes, or dropdown)
-        selectors = [
-            f"input[type='radio'][value*='{config['form_value']}']",
-            f"input[type='checkbox'][value*='{config['form_value']}']",
-            f"label:has-text('{report_name}')",
-            f"button:has-text('{report_name}')",
-            f"div:has-text('{report_name}')",
-            f"option:has-text('{report_name}')"
-        ]
-        
-        for selector in selectors:
+        selectors = self._SELECTORS_BY_TYPE[report_type]
+        _, element = await self._wait_for_any(selectors, timeout=3000)
+        if element:
             try:
-                element = await self.page.wait_for_selector(selector, timeout=3000)
-                if element:
-                    # Check if it's a radio/checkbox
-                    tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
-                    
-                    if tag_name == "input":
-                        # Click the input directly
-                        await element.click()
-                    elif tag_name == "label":
-                        # Click the label
-                        await element.click()
-                    elif tag_name == "option":
-                        # It's in a dropdown - need to select it
-                        select = await element.evaluate_handle("el => el.parentElement")
-                        await select.select_option(value=config['form_value'])
-                    else:
-                        # Generic click
-                        await element.click()
-                        
-                    await human_delay(1.0, 2.0)
-                    
-                    # Take screenshot of selection
-                    await self.take_evidence_screenshot(f"selected_{report_type}")
-                    
-                    self.logger.info(f"Successfully selected {report_name}")
-                    return True
+                # Check if it's a radio/checkbox
+                tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
+                
+                if tag_name == "option":
+                    # It's in a dropdown - select it on the parent <select>
+                    await element.locator("xpath=..").select_option(value=config['form_value'])
+                elif not await self._safe_click(element):
+                    # Inputs, labels and anything else are clicked directly
+                    raise PlaywrightTimeout("Report type option not clickable")
                     
+                await self.delay.delay(1.0, 2.0)
+                
+                # Take screenshot of selection
+                await self.schedule_evidence_screenshot(f"selected_{report_type}")
+                
+                self.logger.info(f"Successfully selected {report_name}")
+                return True
+                
             except PlaywrightTimeout:
-                continue
+                pass
                 
         self.logger.warning(f"Could not find selector for report type: {report_name}")
         return False
         
+    async def _human_fill(self, element, text: str) -> None:
+        """
+        Fill an input field.
+        
+        Uses a single fill() call; only stealth_level="paranoid" types the
+        text key by key, for portals that need real keystroke events.
+        """
+        if self.stealth_level == "paranoid":
+            # fill("") focuses and clears in one call
+            await element.fill("")
+            
+            # Type with human-like delays, paced inside the browser so the
+            # whole string is one round-trip
+            await element.press_sequentially(text, delay=random.uniform(50, 150))
+        else:
+            await element.fill(text)
+            
+    def _site_selectors(self) -> Dict[str, str]:
+        """Get the cached field -> selector map for this portal's host."""
+        cls = PhoenixPDScraper
+        if cls._selector_cache is None:
+            try:
+                cls._selector_cache = json.loads(self._selector_cache_path().read_text())
+            except (OSError, ValueError):
+                cls._selector_cache = {}
+                
+        return cls._selector_cache.setdefault(urlsplit(self.portal_url).hostname, {})
+        
+    def _selector_cache_path(self) -> Path:
+        """Location of the persisted selector cache."""
+        return self.evidence_dir / "selectors.json"
+        
+    def _save_selector_cache(self, text: str) -> None:
+        """Persist a serialized selector cache (runs in a worker thread)."""
+        self._write_atomic(self._selector_cache_path(), text)
+        
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        """
+        Write a text file (blocking; run it in a worker thread).
+        
+        Writes a temporary file and renames it over the target, so concurrent
+        saves never leave a truncated file behind.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+            
+    async def _find_field(self, field: str):
+        """
+        Locate the input for a form field.
+        
+        The selector that worked last time on this portal is tried first
+        with a short timeout; otherwise every known pattern is raced and the
+        winner is remembered for the next submission.
+        """
+        selectors = self._site_selectors()
+        cached = selectors.get(field)
+        if cached:
+            locator = self.page.locator(cached).first
+            try:
+                await locator.wait_for(state="visible", timeout=500)
+                return locator
+            except PlaywrightTimeout:
+                pass
+                
+        pattern, element = await self._wait_for_any(self.FIELD_MAPPINGS[field], timeout=2000)
+        if element and pattern != cached:
+            selectors[field] = pattern
+            try:
+                # Serialize on the loop: other scrapers mutate the cache
+                text = json.dumps(PhoenixPDScraper._selector_cache, indent=2)
+                await asyncio.to_thread(self._save_selector_cache, text)
+            except OSError as e:
+                self.logger.warning(f"Could not save selector cache: {e}")
+                
+        return element
+        
+    async def _fill_field(self, field: str, value: str) -> bool:
+        """Find the input for a form field and fill it in."""
+        element = await self._find_field(field)
+        if not element:
+            return False
+            
+        try:
+            await self._human_fill(element, value)
+            self._filled_values[field] = value
+            return True
+        except PlaywrightTimeout:
+            return False
+            
+    async def _prepare_submission(
+        self,
+        report_type: str,
+        case_number: str,
+        requestor_info: Dict[str, str],
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Sanitize and validate a submission in the default thread pool.
+        
+        Keeps the CPU-bound sanitizers off the event loop that is driving
+        the browsers during batch runs.
+        
+        Raises:
+            ValueError: If the submission fails validation
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                prepare_phoenix_submission,
+                report_type=report_type,
+                case_number=case_number,
+                requestor_info=requestor_info,
+                additional_data=additional_data
+            )
+        )
+        
     async def fill_request_form(
         self,
         report_type: str,
@@ -348,278 +920,398 @@ class PhoenixPDScraper(BaseScraper):
         
         # Prepare and sanitize all inputs
         try:
-            sanitized_data = prepare_phoenix_submission(
-                report_type=report_type,
-                case_number=case_number,
-                requestor_info=requestor_info,
-                additional_data=additional_data
+            sanitized_data = await self._prepare_submission(
+                report_type, case_number, requestor_info, additional_data
             )
         except ValueError as e:
             self.logger.error(f"Validation failed: {e}")
             return False
             
-        # Common input field patterns
-        field_mappings = {
-            "case_number": [
-                "input[name*='case']",
-                "input[name*='report']",
-                "input[name*='number']",
-                "input[id*='case']",
-                "input[placeholder*='case']",
-                "input[placeholder*='report']"
-            ],
-            "first_name": [
-                "input[name*='first']",
-                "input[name*='fname']",
-                "input[id*='first']",
-                "input[placeholder*='first']"
-            ],
-            "last_name": [
-                "input[name*='last']",
-                "input[name*='lname']",
-                "input[id*='last']",
-                "input[placeholder*='last']"
-            ],
-            "email": [
-                "input[type='email']",
-                "input[name*='email']",
-                "input[id*='email']",
-                "input[placeholder*='email']"
-            ],
-            "phone": [
-                "input[type='tel']",
-                "input[name*='phone']",
-                "input[id*='phone']",
-                "input[placeholder*='phone']"
-            ],
-            "address": [
-                "input[name*='address']",
-                "input[id*='address']",
-                "input[placeholder*='address']",
-                "textarea[name*='address']"
-            ],
-            "date": [
-                "input[type='date']",
-                "input[name*='date']",
-                "input[id*='date']",
-                "input[placeholder*='date']"
-            ],
-            "officer_badge": [
-                "input[name*='officer']",
-                "input[name*='badge']",
-                "input[id*='officer']",
-                "input[placeholder*='officer']"
-            ]
-        }
-        
         filled_fields = 0
         
         # Fill case number if required for this report type
-        if "case_number" in self.REPORT_CONFIGS[report_type]["fields"]:
+        if "case_number" in self._FIELDS_BY_TYPE[report_type]:
             sanitized_case = sanitized_data["case_number"]
             
-            for selector in field_mappings["case_number"]:
-                try:
-                    element = await self.page.wait_for_selector(selector, timeout=2000)
-                    if element:
-                        # Clear existing value
-                        await element.click()
-                        await self.page.keyboard.press("Control+A")
-                        await self.page.keyboard.press("Delete")
-                        
-                        # Type with human-like delays
-                        for char in sanitized_case:
-                            await self.page.keyboard.type(char)
-                            await asyncio.sleep(random.uniform(0.05, 0.15))
-                        
-                        filled_fields += 1
-                        self.logger.info(f"Filled case number: {sanitized_case}")
-                        break
-                        
-                except PlaywrightTimeout:
-                    continue
+            if await self._fill_field("case_number", sanitized_case):
+                filled_fields += 1
+                self.logger.info(f"Filled case number: {sanitized_case}")
                     
         # Fill requestor information
         for field, value in sanitized_data["requestor_info"].items():
-            if field in field_mappings and value:
-                await human_delay(0.5, 1.5)
+            if field in self.FIELD_MAPPINGS and value:
+                await self.delay.delay(0.2, 0.6)
                 
-                for selector in field_mappings[field]:
-                    try:
-                        element = await self.page.wait_for_selector(selector, timeout=2000)
-                        if element:
-                            await element.click()
-                            await self.page.keyboard.press("Control+A")
-                            await self.page.keyboard.press("Delete")
-                            
-                            # Type with human-like delays
-                            for char in str(value):
-                                await self.page.keyboard.type(char)
-                                await asyncio.sleep(random.uniform(0.05, 0.15))
-                                
-                            filled_fields += 1
-                            self.logger.info(f"Filled {field}")
-                            break
-                            
-                    except PlaywrightTimeout:
-                        continue
+                if await self._fill_field(field, str(value)):
+                    filled_fields += 1
+                    self.logger.info(f"Filled {field}")
                         
         # Fill additional fields if provided
         if sanitized_data.get("additional_data"):
             for field, value in sanitized_data["additional_data"].items():
-                if field in field_mappings and value:
-                    await human_delay(0.5, 1.5)
+                if field in self.FIELD_MAPPINGS and value:
+                    await self.delay.delay(0.2, 0.6)
                     
-                    for selector in field_mappings[field]:
-                        try:
-                            element = await self.page.wait_for_selector(selector, timeout=2000)
-                            if element:
-                                await element.click()
-                                await self.page.keyboard.press("Control+A")
-                                await self.page.keyboard.press("Delete")
-                                
-                                # Handle dates specially
-                                if field == "date" and isinstance(value, datetime):
-                                    value = value.strftime("%m/%d/%Y")
-                                    
-                                # Type with human-like delays
-                                for char in str(value):
-                                    await self.page.keyboard.type(char)
-                                    await asyncio.sleep(random.uniform(0.05, 0.15))
-                                    
-                                filled_fields += 1
-                                self.logger.info(f"Filled {field}")
-                                break
-                                
-                        except PlaywrightTimeout:
-                            continue
+                    # Handle dates specially
+                    if field == "date" and isinstance(value, datetime):
+                        value = value.strftime("%m/%d/%Y")
+                        
+                    if await self._fill_field(field, str(value)):
+                        filled_fields += 1
+                        self.logger.info(f"Filled {field}")
                         
         # Take screenshot of filled form
-        await self.take_evidence_screenshot(f"form_filled_{report_type}_{case_number}")
+        await self.schedule_evidence_screenshot(f"form_filled_{report_type}_{case_number}")
         
         return filled_fields >= 2  # At least case number and one other field
         
+    async def _prepare_submit_button(self):
+        """Find, scroll to and hover the submit button."""
+        _, element = await self._wait_for_any(self.SUBMIT_PATTERNS, timeout=8000)
+        if not element:
+            raise PlaywrightTimeout("Submit button not found")
+            
+        # Scroll to element
+        await element.scroll_into_view_if_needed()
+        await self.delay.delay(1.0, 2.0)
+        
+        # Hover before clicking
+        await element.hover()
+        await self.delay.micro_delay()
+        return element
+        
     async def submit_form(self) -> bool:
         """Submit the form with human-like behavior."""
         self.logger.info("Looking for submit button")
         
-        # Common submit button patterns
-        submit_patterns = [
-            "button[type='submit']",
-            "input[type='submit']",
-            "button:has-text('Submit')",
-            "button:has-text('Send')",
-            "button:has-text('Request')",
-            "button:has-text('Continue')",
-            "input[value*='Submit']"
-        ]
-        
-        for pattern in submit_patterns:
+        try:
+            # Retry getting the button ready; the click itself is never
+            # retried so a request cannot be submitted twice
+            element = await self._retry(self._prepare_submit_button, attempts=2)
+        except PlaywrightTimeout:
+            return False
+            
+        try:
+            # Take pre-submit screenshot
+            await self.schedule_evidence_screenshot("pre_submit")
+            
+            # Hidden inputs carry per-session state that must not be learned
             try:
-                element = await self.page.wait_for_selector(pattern, timeout=3000)
-                if element:
-                    # Scroll to element
-                    await element.scroll_into_view_if_needed()
-                    await human_delay(1.0, 2.0)
-                    
-                    # Hover before clicking
-                    await element.hover()
-                    await random_micro_delay()
-                    
-                    # Take pre-submit screenshot
-                    await self.take_evidence_screenshot("pre_submit")
-                    
-                    # Click submit
-                    await element.click()
-                    
-                    # Wait for response
-                    await self.page.wait_for_load_state("networkidle")
+                self._hidden_fields = set(await self.page.eval_on_selector_all(
+                    "input[type='hidden']", "els => els.map(el => el.name)"
+                ))
+            except Exception:
+                self._hidden_fields = set()
+                
+            # Record the POSTs the click triggers so the endpoint can be learned
+            captured = self._captured_posts = []
+            def on_request(request):
+                if request.method == "POST":
+                    captured.append(request)
                     
-                    return True
+            self.page.on("request", on_request)
+            try:
+                # Click submit
+                if not await self._safe_click(element, timeout=5000):
+                    return False
+                
+                # Wait for the response page to show an outcome
+                await self.page.wait_for_load_state("domcontentloaded")
+                try:
+                    await self.page.get_by_text(self.SUCCESS_TEXT).first.wait_for(timeout=15000)
+                except PlaywrightTimeout:
+                    self.logger.warning("No success message seen after submitting")
                     
-            except PlaywrightTimeout:
-                continue
+            finally:
+                self.page.remove_listener("request", on_request)
                 
-        return False
+            return True
+            
+        except PlaywrightTimeout:
+            return False
         
     async def extract_confirmation(self) -> Optional[Dict[str, Any]]:
         """Extract confirmation details from the page."""
         self.logger.info("Extracting confirmation details")
         
         # Wait for potential confirmation elements
-        await human_delay(3.0, 5.0)
+        await self.delay.delay(3.0, 5.0)
         
         # Take screenshot first
-        await self.take_evidence_screenshot("confirmation_page")
-        
-        # Get page content
-        page_content = await self.page.content()
-        page_text = await self.page.inner_text("body")
-        
-        # Look for confirmation patterns
-        confirmation_patterns = [
-            r"Confirmation\s*#?:?\s*([A-Z0-9-]+)",
-            r"Reference\s*#?:?\s*([A-Z0-9-]+)",
-            r"Request\s*ID\s*:?\s*([A-Z0-9-]+)",
-            r"Tracking\s*#?:?\s*([A-Z0-9-]+)",
-            r"Ticket\s*#?:?\s*([A-Z0-9-]+)",
-            r"Case\s*#?:?\s*([A-Z0-9-]+)"
-        ]
+        await self.schedule_evidence_screenshot("confirmation_page", full_page=True)
+        
+        # Visible text is all we match against; read it in one evaluate
+        # rather than serializing the HTML or resolving an element handle
+        page_text = await self.page.evaluate("() => document.body.innerText")
         
         confirmation_number = None
-        for pattern in confirmation_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in self.CONFIRMATION_PATTERNS:
+            match = pattern.search(page_text)
             if match:
                 confirmation_number = match.group(1)
                 self.logger.info(f"Found confirmation number: {confirmation_number}")
                 break
                 
-        # Extract any success messages
-        success_indicators = [
-            "success",
-            "received",
-            "submitted",
-            "thank you",
-            "confirmation",
-            "complete"
-        ]
-        
+        # Extract the first sentence carrying a success message by slicing
+        # around the first match instead of splitting the whole page
         status_message = ""
-        for indicator in success_indicators:
-            if indicator in page_text.lower():
-                # Find the sentence containing the indicator
-                sentences = page_text.split(".")
-                for sentence in sentences:
-                    if indicator in sentence.lower():
-                        status_message = sentence.strip()
-                        break
-                        
-        return {
+        match = self.SUCCESS_TEXT.search(page_text)
+        if match:
+            start = page_text.rfind(".", 0, match.start()) + 1
+            end = page_text.find(".", match.end())
+            status_message = page_text[start:end if end != -1 else None].strip()
+                    
+        result = {
             "number": confirmation_number or f"PHOENIX-{datetime.now().strftime('%Y%m%d%H%M%S')}",
             "status_message": status_message,
             "page_url": self.page.url,
-            "extracted_at": datetime.utcnow().isoformat(),
-            "full_text": page_text if self.logger.level <= 10 else None
+            "extracted_at": datetime.utcnow().isoformat()
         }
         
-    async def take_evidence_screenshot(self, name: str) -> Path:
-        """Take a screenshot for evidence/audit trail."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.name}_{name}_{timestamp}.png"
-        filepath = self.evidence_dir / filename
+        # Page text is only for debugging; keep it out of stored results
+        if self.logger.isEnabledFor(logging.DEBUG):
+            result["full_text"] = page_text[:self.FULL_TEXT_LIMIT]
+            
+        return result
+        
+    @classmethod
+    def load_api_spec(cls) -> Optional[Dict[str, Any]]:
+        """Load the learned submission endpoint, if one has been recorded."""
+        if cls._api_spec is None and cls.API_SPEC_PATH.exists():
+            try:
+                PhoenixPDScraper._api_spec = json.loads(cls.API_SPEC_PATH.read_text())
+            except (OSError, ValueError):
+                # An unreadable spec just means the browser flow is used
+                return None
+                
+        return cls._api_spec
+        
+    async def _learn_api(self) -> None:
+        """
+        Record the POST behind a successful browser submission.
+        
+        Form keys whose value matches something we filled in are mapped to
+        that field; the rest are kept as constants, except hidden inputs and
+        token-like keys, which are only valid for the session that sent them.
+        """
+        by_value = {value: field for field, value in self._filled_values.items()}
         
+        for request in self._captured_posts:
+            if urlsplit(request.url).hostname not in self.CACHE_HOSTS:
+                continue
+                
+            content_type = request.headers.get("content-type", "")
+            try:
+                if "json" in content_type:
+                    body = {k: str(v) for k, v in (request.post_data_json or {}).items()}
+                else:
+                    body = dict(parse_qsl(request.post_data or ""))
+            except (ValueError, AttributeError):
+                continue
+                
+            fields = {key: by_value[value] for key, value in body.items() if value in by_value}
+            if len(fields) < 2:
+                continue
+                
+            spec = {
+                "url": request.url,
+                "content_type": "json" if "json" in content_type else "form",
+                "fields": fields,
+                "constants": {
+                    k: v for k, v in body.items()
+                    if k not in fields
+                    and k not in self._hidden_fields
+                    and not self.SESSION_TOKEN_KEYS.search(k)
+                },
+            }
+            PhoenixPDScraper._api_spec = spec
+            self.logger.info(f"Learned submission endpoint: {request.url}")
+            try:
+                await asyncio.to_thread(
+                    self._write_atomic, self.API_SPEC_PATH, json.dumps(spec, indent=2)
+                )
+            except OSError as e:
+                self.logger.warning(f"Could not save learned endpoint: {e}")
+            return
+            
+    async def _api_payload(
+        self,
+        report_type: str,
+        case_number: str,
+        requestor_info: Dict[str, str],
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, str]]:
+        """Build the flat field -> value payload the browser flow would type."""
         try:
-            await self.page.screenshot(
-                path=str(filepath),
-                full_page=True
+            sanitized_data = await self._prepare_submission(
+                report_type, case_number, requestor_info, additional_data
             )
-            self.logger.info(f"Evidence screenshot saved: {filepath}")
+        except ValueError:
+            return None
+            
+        payload = {"report_type": self.REPORT_CONFIGS[report_type]["form_value"]}
+        if "case_number" in self._FIELDS_BY_TYPE[report_type]:
+            payload["case_number"] = sanitized_data["case_number"]
+            
+        extra = sanitized_data.get("additional_data") or {}
+        for field, value in {**sanitized_data["requestor_info"], **extra}.items():
+            if field in self.FIELD_MAPPINGS and value:
+                if field == "date" and isinstance(value, datetime):
+                    value = value.strftime("%m/%d/%Y")
+                payload[field] = str(value)
+                
+        return payload
+        
+    async def submit_via_api(self, payload: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Submit directly to the learned endpoint, bypassing the DOM.
+        
+        Args:
+            payload: Field -> value mapping as built by _api_payload
+            
+        Returns:
+            Confirmation details shaped like extract_confirmation(); a dict
+            with status "unknown" if the POST reached the portal but did not
+            confirm; or None if nothing was sent (no learned endpoint,
+            incomplete payload, or the connection was refused)
+        """
+        spec = self.load_api_spec()
+        if not spec or self._context is None:
+            return None
+            
+        data = dict(spec["constants"])
+        for key, field in spec["fields"].items():
+            if field not in payload:
+                return None
+            data[key] = payload[field]
+            
+        try:
+            if spec["content_type"] == "json":
+                response = await self._context.request.post(spec["url"], data=data)
+            else:
+                response = await self._context.request.post(spec["url"], form=data)
+        except Exception as e:
+            if self.UNSENT_ERRORS.search(str(e)):
+                self.logger.warning(f"API submission not sent: {e}")
+                return None
+            return self._unknown_api_outcome(f"API submission failed: {e}")
+            
+        # From here on the portal has the request, so never retry via the
+        # browser: that could file the same paid request twice
+        if not response.ok:
+            # The portal rejected the learned request; relearn it next time
+            await self._forget_api_spec()
+            return self._unknown_api_outcome(f"API submission returned {response.status}")
+            
+        try:
+            text = await response.text()
+        except Exception as e:
+            return self._unknown_api_outcome(f"Could not read API response: {e}")
+            
+        confirmation_number = None
+        for pattern in self.CONFIRMATION_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                confirmation_number = match.group(1)
+                break
+                
+        if not confirmation_number:
+            await self._forget_api_spec()
+            return self._unknown_api_outcome("API response had no confirmation number")
+            
+        return {
+            "number": confirmation_number,
+            "status_message": "",
+            "page_url": response.url,
+            "extracted_at": datetime.utcnow().isoformat(),
+            "via": "api"
+        }
+        
+    async def _forget_api_spec(self) -> None:
+        """Drop the learned endpoint so later submissions use the browser."""
+        # An empty spec marks it as known-absent, so the file isn't reloaded
+        PhoenixPDScraper._api_spec = {}
+        try:
+            await asyncio.to_thread(self.API_SPEC_PATH.unlink, missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Could not delete learned endpoint: {e}")
+            
+    def _unknown_api_outcome(self, error: str) -> Dict[str, Any]:
+        """Log and describe an API submission that may or may not have been filed."""
+        self.logger.error(f"{error}; submission outcome unknown")
+        return {"status": "unknown", "error": error, "via": "api"}
+        
+    async def schedule_evidence_screenshot(self, name: str, full_page: bool = False) -> Optional[Path]:
+        """
+        Capture a screenshot for the evidence/audit trail.
+        
+        Intermediate steps are kept in memory as small viewport JPEGs and
+        only written out if the submission fails (see flush_evidence).
+        Full-page captures (the confirmation page) and, when always_save is
+        set, viewport JPEGs of every step are written in the background
+        straight away; close() waits for outstanding writes.
+        
+        Args:
+            name: Step name used in the filename
+            full_page: Capture the whole page losslessly and always keep it
+        """
+        # Nanosecond stamp plus a process-wide sequence number keeps names
+        # unique when parallel submissions screenshot in the same second
+        stamp = time.time_ns()
+        
+        # Only full-page evidence is kept lossless
+        extension = "png" if full_page else "jpg"
+        filename = f"{self.name}_{name}_{stamp}_{next(_SCREENSHOT_SEQ)}.{extension}"
+        
+        # Shard by day so no single evidence directory grows without bound
+        day = time.strftime("%Y/%m/%d", time.localtime(stamp // 1_000_000_000))
+        filepath = self.evidence_dir / day / filename
+        
+        try:
+            if full_page:
+                data = await self.page.screenshot(full_page=True)
+                self._queue_evidence_write(filepath, data)
+            elif self.always_save:
+                data = await self.page.screenshot(type="jpeg", quality=80)
+                self._queue_evidence_write(filepath, data)
+            else:
+                data = await self.page.screenshot(type="jpeg", quality=40)
+                self._evidence_buffer.append((filepath, data))
+                
             return filepath
             
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {e}")
             return None
             
+    def _queue_evidence_write(self, filepath: Path, data: bytes) -> None:
+        """Write a captured screenshot to disk in the background."""
+        if filepath.parent not in self._ready_evidence_dirs:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._ready_evidence_dirs.add(filepath.parent)
+            
+        task = asyncio.create_task(self._write_evidence(filepath, data))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+        
+        self._screenshots.append(str(filepath))
+        
+    def flush_evidence(self) -> None:
+        """Write out every buffered intermediate screenshot."""
+        for filepath, data in self._evidence_buffer:
+            self._queue_evidence_write(filepath, data)
+        self._evidence_buffer.clear()
+        
+    async def _write_evidence(self, filepath: Path, data: bytes) -> None:
+        """Write a captured evidence screenshot to disk."""
+        try:
+            async with aiofiles.open(filepath, "wb") as f:
+                await f.write(data)
+            self.logger.info(f"Evidence screenshot saved: {filepath}")
+            
+        except OSError as e:
+            self.logger.error(f"Failed to save screenshot {filepath}: {e}")
+            
     async def submit_report_request(
         self,
         report_type: str,
@@ -637,8 +1329,19 @@ class PhoenixPDScraper(BaseScraper):
             additional_data: Additional data required for specific report types
             
         Returns:
-            Dictionary with confirmation details or None if failed
+            Dictionary with confirmation details, a dict with status
+            "unknown" if a direct API submission may have been filed without
+            confirming, or None if failed
         """
+        # Borrow a pooled context for this submission unless the caller
+        # already opened one via the async context manager
+        owns_page = self.page is None
+        self._screenshots = screenshots = []
+        self._filled_values = {}
+        self._captured_posts = []
+        self._hidden_fields = set()
+        self._evidence_buffer = []
+        
         try:
             # Validate report type
             if report_type not in self.REPORT_CONFIGS:
@@ -647,6 +1350,24 @@ class PhoenixPDScraper(BaseScraper):
                 
             config = self.REPORT_CONFIGS[report_type]
             
+            if owns_page:
+                await self.setup()
+                
+            # Try the learned endpoint first; fall back to the browser flow
+            if self.load_api_spec():
+                payload = await self._api_payload(report_type, case_number, requestor_info, additional_data)
+                confirmation = await self.submit_via_api(payload) if payload else None
+                if confirmation and confirmation.get("status") == "unknown":
+                    return {
+                        **confirmation,
+                        "report_type": report_type,
+                        "case_number": case_number
+                    }
+                if confirmation:
+                    self._evidence_buffer.clear()
+                    return self._submission_result(report_type, case_number, confirmation, screenshots)
+                self.logger.info("API submission unavailable, using browser flow")
+                
             # Navigate to portal
             if not await self.navigate_to_portal():
                 return None
@@ -655,16 +1376,19 @@ class PhoenixPDScraper(BaseScraper):
             if not await self.find_request_form():
                 self.logger.error("Could not find request form")
                 return None
+            await self.delay.maybe_break()
                 
             # Select the report type
             if not await self.select_report_type(report_type):
                 self.logger.error(f"Could not select report type: {report_type}")
                 return None
+            await self.delay.maybe_break()
                 
             # Fill the form with sanitized inputs
             if not await self.fill_request_form(report_type, case_number, requestor_info, additional_data):
                 self.logger.error("Could not fill form properly")
                 return None
+            await self.delay.maybe_break()
                 
             # Submit the form
             if not await self.submit_form():
@@ -675,26 +1399,84 @@ class PhoenixPDScraper(BaseScraper):
             confirmation = await self.extract_confirmation()
             
             if confirmation:
-                return {
-                    "status": "submitted",
-                    "report_type": report_type,
-                    "report_name": config["name"],
-                    "base_fee": config["base_fee"],
-                    "confirmation_number": confirmation.get("number"),
-                    "submitted_at": datetime.utcnow().isoformat(),
-                    "case_number": case_number,
-                    "portal_response": confirmation,
-                    "evidence_screenshots": [
-                        str(f) for f in self.evidence_dir.glob(f"*{report_type}*{case_number}*")
-                    ]
-                }
+                if self._filled_values:
+                    self._filled_values["report_type"] = config["form_value"]
+                    # Best effort: the request is filed, so a failure here
+                    # must not turn it into a failed (and retried) submission
+                    try:
+                        await self._learn_api()
+                    except Exception as e:
+                        self.logger.warning(f"Could not learn submission endpoint: {e}")
+                self._evidence_buffer.clear()
+                return self._submission_result(report_type, case_number, confirmation, screenshots)
             else:
                 return None
                 
         except Exception as e:
             await self.handle_error(e, "submit_report_request")
+            # Don't hand a context in an unknown state to the next submission
+            self._context_dirty = True
             return None
             
+        finally:
+            # Anything still buffered belongs to a failed submission
+            self.flush_evidence()
+            if owns_page:
+                await self.close()
+            
+    def _submission_result(
+        self,
+        report_type: str,
+        case_number: str,
+        confirmation: Dict[str, Any],
+        screenshots: List[str]
+    ) -> Dict[str, Any]:
+        """Build the result returned for a confirmed submission."""
+        config = self.REPORT_CONFIGS[report_type]
+        return {
+            "status": "submitted",
+            "report_type": report_type,
+            "report_name": config["name"],
+            "base_fee": config["base_fee"],
+            "confirmation_number": confirmation.get("number"),
+            "submitted_at": datetime.utcnow().isoformat(),
+            "case_number": case_number,
+            "portal_response": confirmation,
+            "evidence_screenshots": screenshots
+        }
+        
+    async def submit_report_requests_batch(
+        self,
+        cases: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Submit several report requests concurrently.
+        
+        Each case runs on its own scraper instance (and therefore its own
+        page), borrowing contexts from the shared pool.
+        
+        Args:
+            cases: Keyword arguments for each submit_report_request call
+            max_concurrency: Maximum number of submissions in flight
+                (default: the context pool size, since extra submissions
+                would only queue for a context)
+            
+        Returns:
+            Results in the same order as cases; a failed case yields None
+            or the exception it raised
+        """
+        semaphore = asyncio.BoundedSemaphore(max_concurrency or self._context_pool.pool_size)
+        
+        async def _submit_one(case: Dict[str, Any]):
+            async with semaphore:
+                return await self.clone().submit_report_request(**case)
+                
+        return await asyncio.gather(
+            *[_submit_one(case) for case in cases],
+            return_exceptions=True
+        )
+        
     async def scrape(self, **kwargs) -> Dict[str, Any]:
         """Main scraping method."""
         action = kwargs.get("action", "submit_request")
@@ -727,6 +1509,22 @@ class PhoenixPDScraper(BaseScraper):
                 additional_data=additional_data
             )
             
+        elif action == "submit_batch":
+            results = await self.submit_report_requests_batch(
+                cases=kwargs.get("cases", []),
+                max_concurrency=kwargs.get("max_concurrency")
+            )
+            
+            result = {
+                "status": "batch_complete",
+                "action": action,
+                "results": [
+                    r if isinstance(r, dict)
+                    else {"status": "failed", "error": str(r) if r else None}
+                    for r in results
+                ]
+            }
+            
         else:
             raise ValueError(f"Unknown action: {action}")
             
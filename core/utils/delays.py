@@ -5,6 +5,7 @@ Provides realistic delays to avoid detection.
 """
 
 import asyncio
+import math
 import random
 from typing import Union
 
@@ -21,6 +22,101 @@ async def human_delay(min_seconds: float = 0.5, max_seconds: float = 2.0) -> Non
     await asyncio.sleep(delay)
 
 
+async def human_delay_lognormal(
+    mu: float,
+    sigma: float,
+    min_seconds: float,
+    max_seconds: float
+) -> None:
+    """
+    Add a log-normally distributed delay, clamped to a range.
+    
+    Human reaction times are right-skewed: mostly quick with an occasional
+    long pause. A log-normal models that better than a uniform spread.
+    
+    Args:
+        mu: Mean of the underlying normal distribution (log seconds)
+        sigma: Standard deviation of the underlying normal distribution
+        min_seconds: Minimum delay in seconds
+        max_seconds: Maximum delay in seconds
+    """
+    delay = random.lognormvariate(mu, sigma)
+    await asyncio.sleep(min(max_seconds, max(min_seconds, delay)))
+
+
+class HumanDelayProfile:
+    """
+    Per-session delay profile with periodic reading breaks.
+    
+    Delays are log-normal with their median at the geometric mean of the
+    requested range, scaled by the profile's speed. Every so many actions
+    the session takes a longer break, as a person reading the page would.
+    """
+    
+    # name: (range scale, sigma, actions between breaks, break range in seconds);
+    # "off" skips every delay, for portals that don't fingerprint
+    PROFILES = {
+        "off": (0.0, 0.0, 0, (0.0, 0.0)),
+        "fast": (0.5, 0.3, 25, (2.0, 5.0)),
+        "moderate": (1.0, 0.4, 15, (4.0, 10.0)),
+        "cautious": (1.5, 0.5, 10, (8.0, 20.0)),
+        "stealth": (2.0, 0.6, 6, (15.0, 40.0)),
+    }
+    
+    def __init__(self, name: str = "moderate"):
+        """
+        Initialize the delay profile.
+        
+        Args:
+            name: One of "off", "fast", "moderate", "cautious" or "stealth"
+        """
+        if name not in self.PROFILES:
+            raise ValueError(f"Unknown delay profile: {name}")
+            
+        self.name = name
+        self.scale, self.sigma, self.break_every, self.break_range = self.PROFILES[name]
+        self.actions = 0
+        self._next_break = self._schedule_break()
+        
+    def _schedule_break(self) -> float:
+        """Pick the action count at which the next break is due."""
+        if not self.break_every:
+            return math.inf
+            
+        spread = max(1, self.break_every // 3)
+        return self.actions + random.randint(self.break_every - spread, self.break_every + spread)
+        
+    async def delay(self, min_seconds: float = 0.5, max_seconds: float = 2.0) -> None:
+        """
+        Add a delay between actions.
+        
+        Args:
+            min_seconds: Minimum delay in seconds before scaling (must be > 0)
+            max_seconds: Maximum delay in seconds before scaling
+        """
+        self.actions += 1
+        if not self.scale:
+            return
+            
+        low = min_seconds * self.scale
+        high = max_seconds * self.scale
+        mu = math.log(math.sqrt(low * high))
+        await human_delay_lognormal(mu, self.sigma, low, high)
+        
+    async def maybe_break(self) -> None:
+        """Take a reading break if enough actions have passed since the last."""
+        if self.actions < self._next_break:
+            return
+            
+        await human_delay(*self.break_range)
+        self._next_break = self._schedule_break()
+        
+    async def micro_delay(self) -> None:
+        """Add a small random delay between 50-150ms unless delays are off."""
+        if self.scale:
+            await random_micro_delay()
+
+
 def get_typing_delay(text: str, wpm: int = 40) -> float:
     """
     Calculate realistic typing delay based on text length.
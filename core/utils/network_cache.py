@@ -0,0 +1,131 @@
+"""
+On-disk cache for idempotent HTTP responses.
+
+Lets scrapers serve static portal assets from disk instead of downloading
+them again on every submission.
+"""
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiofiles
+
+
+# Headers that no longer describe the body once Playwright has decoded it
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class NetworkCache:
+    """
+    Filesystem cache of HTTP responses.
+    
+    Entries live under <root>/<host>/<path>/<METHOD>/ as a raw body file
+    plus a headers.json file holding the status and response headers.
+    """
+    
+    def __init__(self, root: Path, ttl: float = 3600):
+        """
+        Initialize the network cache.
+        
+        Args:
+            root: Directory holding cached responses
+            ttl: Seconds a cached response stays valid
+        """
+        self.root = Path(root)
+        self.ttl = ttl
+    
+    def _entry_dir(self, url: str, method: str) -> Path:
+        """Get the directory for a cached URL."""
+        parts = urlsplit(url)
+        path = parts.path.strip("/").replace("/", "_") or "_root"
+        
+        # Keep distinct query strings apart without long directory names
+        if parts.query:
+            path += "_" + hashlib.blake2b(parts.query.encode(), digest_size=8).hexdigest()
+        
+        return self.root / parts.netloc / path[:200] / method.upper()
+    
+    async def get(
+        self,
+        url: str,
+        method: str = "GET"
+    ) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            url: Request URL
+            method: HTTP method
+        
+        Returns:
+            Tuple of (status, headers, body), or None if missing or expired
+        """
+        entry = self._entry_dir(url, method)
+        meta_path = entry / "headers.json"
+        
+        try:
+            if time.time() - meta_path.stat().st_mtime > self.ttl:
+                return None
+            
+            async with aiofiles.open(meta_path, "r") as f:
+                meta = json.loads(await f.read())
+            async with aiofiles.open(entry / "body", "rb") as f:
+                body = await f.read()
+        
+        except (OSError, ValueError):
+            return None
+        
+        return meta["status"], meta["headers"], body
+    
+    async def put(
+        self,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        method: str = "GET"
+    ) -> None:
+        """
+        Store a response.
+        
+        Args:
+            url: Request URL
+            status: HTTP status code
+            headers: Response headers
+            body: Decoded response body
+            method: HTTP method
+        """
+        entry = self._entry_dir(url, method)
+        entry.mkdir(parents=True, exist_ok=True)
+        
+        meta = {
+            "status": status,
+            "headers": {
+                name: value for name, value in headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            }
+        }
+        
+        # Write each file under a temporary name and rename it into place,
+        # so a concurrent get() never reads a partly written file. The body
+        # goes first: headers.json marks the entry complete.
+        await self._write_atomic(entry / "body", body)
+        await self._write_atomic(entry / "headers.json", json.dumps(meta).encode())
+    
+    @staticmethod
+    async def _write_atomic(path: Path, data: bytes) -> None:
+        """Write a file via a temporary sibling and os.replace()."""
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
@@ -7,10 +7,41 @@ Implements the automatic discount structure:
 - 51+ reports: $29.40 each (40% discount)
 """
 
+from functools import lru_cache
 from typing import Dict, Tuple, List
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal, ROUND_HALF_EVEN
 
 
+# All arithmetic is done in integer cents; Decimal only appears at the
+# boundary of the public functions
+BASE_PRICE_CENTS = 4900
+
+# (minimum quantity, discount percent, price per credit in cents)
+_CENTS_TIERS = (
+    (51, 40, BASE_PRICE_CENTS * 60 // 100),  # 60% of original price
+    (11, 20, BASE_PRICE_CENTS * 80 // 100),  # 80% of original price
+)
+
+
+def _to_dollars(cents: int) -> Decimal:
+    """Convert integer cents to a two-place Decimal dollar amount."""
+    return Decimal(cents).scaleb(-2)
+
+
+def _to_cents(amount: Decimal) -> int:
+    """Convert a Decimal dollar amount to integer cents, rounding half-even."""
+    return int(amount.scaleb(2).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def _volume_discount_cents(quantity: int) -> Tuple[int, int]:
+    """Get (discount_percent, price_per_credit_cents) for a quantity."""
+    return next(
+        ((discount, cents) for minimum, discount, cents in _CENTS_TIERS if quantity >= minimum),
+        (0, BASE_PRICE_CENTS)
+    )
+
+
+@lru_cache(maxsize=4096)
 def get_volume_discount(quantity: int) -> Tuple[int, Decimal]:
     """
     Get discount percentage and price per credit based on quantity.
@@ -21,22 +52,8 @@ def get_volume_discount(quantity: int) -> Tuple[int, Decimal]:
     Returns:
         Tuple of (discount_percent, price_per_credit)
     """
-    base_price = Decimal("49.00")
-    
-    if quantity >= 51:
-        discount = 40
-        price = base_price * Decimal("0.60")  # 60% of original price
-    elif quantity >= 11:
-        discount = 20
-        price = base_price * Decimal("0.80")  # 80% of original price
-    else:
-        discount = 0
-        price = base_price
-        
-    # Round to 2 decimal places
-    price = price.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    
-    return discount, price
+    discount, cents = _volume_discount_cents(quantity)
+    return discount, _to_dollars(cents)
 
 
 def calculate_order_total(quantity: int, include_pd_fee: bool = False, pd_fee: Decimal = Decimal("5.00")) -> Dict[str, Decimal]:
@@ -51,26 +68,33 @@ def calculate_order_total(quantity: int, include_pd_fee: bool = False, pd_fee: D
     Returns:
         Dictionary with pricing breakdown
     """
-    discount_percent, price_per_credit = get_volume_discount(quantity)
+    # Round the fee total, not the per-report fee, so sub-cent fees add up
+    pd_fees_cents = _to_cents(pd_fee * quantity) if include_pd_fee else 0
+    
+    # Callers may add keys to the result, so hand out a fresh dict
+    return dict(_order_total_items(quantity, pd_fees_cents))
+
+
+@lru_cache(maxsize=4096)
+def _order_total_items(quantity: int, pd_fees_cents: int) -> Tuple[Tuple[str, object], ...]:
+    """Cached, immutable pricing breakdown behind calculate_order_total()."""
+    discount_percent, price_cents = _volume_discount_cents(quantity)
     
-    subtotal = price_per_credit * quantity
-    pd_fees_total = pd_fee * quantity if include_pd_fee else Decimal("0")
-    total = subtotal + pd_fees_total
+    subtotal = price_cents * quantity
     
     # Calculate savings
-    full_price = Decimal("49.00") * quantity
-    savings = full_price - subtotal
+    full_price = BASE_PRICE_CENTS * quantity
     
-    return {
-        "quantity": quantity,
-        "price_per_credit": price_per_credit,
-        "discount_percent": discount_percent,
-        "subtotal": subtotal.quantize(Decimal("0.01")),
-        "pd_fees": pd_fees_total.quantize(Decimal("0.01")),
-        "total": total.quantize(Decimal("0.01")),
-        "savings": savings.quantize(Decimal("0.01")),
-        "full_price": full_price.quantize(Decimal("0.01"))
-    }
+    return (
+        ("quantity", quantity),
+        ("price_per_credit", _to_dollars(price_cents)),
+        ("discount_percent", discount_percent),
+        ("subtotal", _to_dollars(subtotal)),
+        ("pd_fees", _to_dollars(pd_fees_cents)),
+        ("total", _to_dollars(subtotal + pd_fees_cents)),
+        ("savings", _to_dollars(full_price - subtotal)),
+        ("full_price", _to_dollars(full_price))
+    )
 
 
 def get_credit_packages() -> List[Dict[str, any]]:
@@ -80,6 +104,12 @@ def get_credit_packages() -> List[Dict[str, any]]:
     Returns:
         List of credit package options
     """
+    # Copies, so callers can't modify the shared table
+    return [dict(package) for package in _CREDIT_PACKAGES]
+
+
+def _build_packages() -> List[Dict[str, any]]:
+    """Build the standard credit packages (run once at import)."""
     packages = []
     
     # Define standard packages
@@ -97,6 +127,11 @@ def get_credit_packages() -> List[Dict[str, any]]:
     return packages
 
 
+# Standard packages never change at runtime, so price them once
+_CREDIT_PACKAGES = tuple(_build_packages())
+_CREDIT_PACKAGES_SORTED = tuple(sorted(_CREDIT_PACKAGES, key=lambda x: x["quantity"]))
+
+
 def calculate_monthly_savings(reports_per_month: int, months: int = 12) -> Dict[str, Decimal]:
     """
     Calculate annual savings for a given monthly volume.
@@ -131,6 +166,7 @@ def calculate_monthly_savings(reports_per_month: int, months: int = 12) -> Dict[
     }
 
 
+@lru_cache(maxsize=1024)
 def format_price_message(quantity: int, include_examples: bool = True) -> str:
     """
     Format a pricing message for the given quantity.
@@ -172,12 +208,10 @@ def get_best_package_for_quantity(quantity: int) -> Dict[str, any]:
     Returns:
         Best package recommendation
     """
-    packages = get_credit_packages()
-    
     # Find the smallest package that covers the need
-    for package in sorted(packages, key=lambda x: x["quantity"]):
+    for package in _CREDIT_PACKAGES_SORTED:
         if package["quantity"] >= quantity:
-            return package
+            return dict(package)
             
     # If no package is large enough, calculate custom
     return calculate_order_total(quantity)
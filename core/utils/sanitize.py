@@ -6,8 +6,43 @@ This module ensures all inputs are safe before submission.
 """
 
 import re
+import time
+from collections import ChainMap
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+
+# Compiled once at import instead of going through re's pattern cache per call
+_WS_RE = re.compile(r'\s+')
+_CASE_RE = re.compile(r'[^A-Za-z0-9\-]')
+_EMAIL_BAD_RE = re.compile(r'[<>&\#]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NONDIGIT_RE = re.compile(r'\D')
+
+# Characters Phoenix PD's portal rejects, mapped to safe replacements
+_PHOENIX_TRANSLATION = str.maketrans({
+    '<': '(',
+    '>': ')',
+    '&': 'and',
+    '#': 'number',
+    '"': "'",
+    '\n': ' ',
+    '\r': ' ',
+    '\t': ' ',
+})
+
+# Non-printable characters that show up in pasted text: C0/C1 controls, DEL,
+# no-break space and soft hyphen
+_CONTROL_STRIP = dict.fromkeys([*range(0x20), *range(0x7F, 0xA1), 0xAD])
+
+# Phoenix PD keeps 911 recordings for 190 days; an incident is still in the
+# window until it is a full 191 days old
+_911_WINDOW_SECONDS = 191 * 86400
+
+
+# The public sanitizers coerce their input to str and then call an
+# lru_cached core, so unhashable values (lists, dicts) still work
 
 
 def sanitize_phoenix_input(text: str) -> str:
@@ -24,28 +59,23 @@ def sanitize_phoenix_input(text: str) -> str:
     """
     if not text:
         return ""
-        
-    # Replace dangerous characters
-    replacements = {
-        '<': '(',
-        '>': ')',
-        '&': 'and',
-        '#': 'number',
-        '"': "'",
-        '\n': ' ',
-        '\r': ' ',
-        '\t': ' ',
-    }
+    return _sanitize_phoenix_input(str(text))
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_phoenix_input(text: str) -> str:
+    # Replace dangerous characters in a single pass
+    result = text.translate(_PHOENIX_TRANSLATION)
     
-    result = str(text)
-    for char, replacement in replacements.items():
-        result = result.replace(char, replacement)
-        
-    # Remove any other non-printable characters
-    result = ''.join(char for char in result if char.isprintable() or char == ' ')
+    # Remove any other non-printable characters (rare, so check in C first)
+    if not result.isprintable():
+        result = result.translate(_CONTROL_STRIP)
+        # Anything left is an unusual format/separator character
+        if not result.isprintable():
+            result = ''.join(char for char in result if char.isprintable())
     
     # Collapse multiple spaces
-    result = re.sub(r'\s+', ' ', result)
+    result = _WS_RE.sub(' ', result)
     
     return result.strip()
 
@@ -62,9 +92,13 @@ def sanitize_case_number(case_number: str) -> str:
     """
     if not case_number:
         raise ValueError("Case number cannot be empty")
-        
+    return _sanitize_case_number(str(case_number))
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_case_number(case_number: str) -> str:
     # Remove all special characters except hyphens and alphanumeric
-    sanitized = re.sub(r'[^A-Za-z0-9\-]', '', str(case_number))
+    sanitized = _CASE_RE.sub('', case_number)
     
     # Ensure it's not empty after sanitization
     if not sanitized:
@@ -85,15 +119,19 @@ def sanitize_email(email: str) -> str:
     """
     if not email:
         return ""
-        
+    return _sanitize_email(str(email))
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_email(email: str) -> str:
     # Basic email validation
-    email = str(email).strip().lower()
+    email = email.strip().lower()
     
     # Remove dangerous characters but keep @ and .
-    email = re.sub(r'[<>&\#]', '', email)
+    email = _EMAIL_BAD_RE.sub('', email)
     
     # Validate email format
-    if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+    if not _EMAIL_RE.match(email):
         raise ValueError(f"Invalid email format: {email}")
         
     return email
@@ -111,9 +149,20 @@ def sanitize_phone(phone: str) -> str:
     """
     if not phone:
         return ""
-        
+    return _sanitize_phone(str(phone))
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_phone(phone: str) -> str:
+    # Fast path: already bare digits
+    if phone.isascii() and phone.isdigit():
+        if len(phone) == 10:
+            return phone
+        if len(phone) == 11 and phone[0] == '1':
+            return phone[1:]
+            
     # Extract only digits
-    digits = re.sub(r'\D', '', str(phone))
+    digits = _NONDIGIT_RE.sub('', phone)
     
     # Validate US phone number length
     if len(digits) == 11 and digits.startswith('1'):
@@ -125,6 +174,17 @@ def sanitize_phone(phone: str) -> str:
     return digits
 
 
+# Sanitizer for each requestor field; other fields are dropped
+_FIELD_SANITIZERS = {
+    'first_name': sanitize_phoenix_input,
+    'last_name': sanitize_phoenix_input,
+    'email': sanitize_email,
+    'phone': sanitize_phone,
+    'company': sanitize_phoenix_input,
+    'address': sanitize_phoenix_input,
+}
+
+
 def sanitize_requestor_info(info: Dict[str, Any]) -> Dict[str, Any]:
     """
     Sanitize all requestor information fields.
@@ -135,28 +195,18 @@ def sanitize_requestor_info(info: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Sanitized dictionary
     """
-    sanitized = {}
-    
-    # Sanitize each field appropriately
-    if 'first_name' in info:
-        sanitized['first_name'] = sanitize_phoenix_input(info['first_name'])
-        
-    if 'last_name' in info:
-        sanitized['last_name'] = sanitize_phoenix_input(info['last_name'])
-        
-    if 'email' in info:
-        sanitized['email'] = sanitize_email(info['email'])
-        
-    if 'phone' in info:
-        sanitized['phone'] = sanitize_phone(info['phone'])
-        
-    if 'company' in info:
-        sanitized['company'] = sanitize_phoenix_input(info['company'])
-        
-    if 'address' in info:
-        sanitized['address'] = sanitize_phoenix_input(info['address'])
-        
-    return sanitized
+    return {
+        field: _FIELD_SANITIZERS[field](value)
+        for field, value in info.items()
+        if field in _FIELD_SANITIZERS
+    }
+
+
+def _utc_timestamp(value: datetime) -> float:
+    """Get a POSIX timestamp, treating naive datetimes as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
 
 
 def validate_911_recording_date(incident_date: datetime) -> bool:
@@ -166,7 +216,7 @@ def validate_911_recording_date(incident_date: datetime) -> bool:
     Phoenix PD only keeps 911 recordings for 190 days.
     
     Args:
-        incident_date: Date of the incident
+        incident_date: Date of the incident (naive datetimes are taken as UTC)
         
     Returns:
         True if within window, False otherwise
@@ -174,10 +224,53 @@ def validate_911_recording_date(incident_date: datetime) -> bool:
     if not incident_date:
         return False
         
-    # Calculate age in days
-    age = datetime.utcnow() - incident_date
-    
-    return age.days <= 190
+    return _utc_timestamp(incident_date) > time.time() - _911_WINDOW_SECONDS
+
+
+def _validate_911(
+    report_type: str,
+    request_data: Dict[str, Any]
+) -> Optional[str]:
+    """911 recordings have 190-day limit."""
+    incident_date = request_data.get('incident_date')
+    if not incident_date:
+        return "911 recordings require an incident date"
+        
+    if not validate_911_recording_date(incident_date):
+        return "911 recordings are only available within 190 days of the incident"
+        
+    return None
+
+
+def _validate_casework(
+    report_type: str,
+    request_data: Dict[str, Any]
+) -> Optional[str]:
+    """Body camera and surveillance may require officer info."""
+    if not request_data.get('case_number') and not request_data.get('officer_badge'):
+        return f"{report_type} requests require either a case number or officer badge number"
+        
+    return None
+
+
+def _validate_calls_for_service(
+    report_type: str,
+    request_data: Dict[str, Any]
+) -> Optional[str]:
+    """Calls for service require an address."""
+    if not request_data.get('address'):
+        return "Calls for service requests require a specific address"
+        
+    return None
+
+
+# Restriction check per report type; types not listed have none
+_VALIDATORS = {
+    "recordings_911": _validate_911,
+    "body_camera": _validate_casework,
+    "surveillance": _validate_casework,
+    "calls_for_service": _validate_calls_for_service,
+}
 
 
 def validate_report_type_restrictions(
@@ -194,26 +287,12 @@ def validate_report_type_restrictions(
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # 911 recordings have 190-day limit
-    if report_type == "recordings_911":
-        incident_date = request_data.get('incident_date')
-        if not incident_date:
-            return False, "911 recordings require an incident date"
-            
-        if not validate_911_recording_date(incident_date):
-            return False, "911 recordings are only available within 190 days of the incident"
-            
-    # Body camera and surveillance may require officer info
-    if report_type in ["body_camera", "surveillance"]:
-        if not request_data.get('case_number') and not request_data.get('officer_badge'):
-            return False, f"{report_type} requests require either a case number or officer badge number"
-            
-    # Calls for service require an address
-    if report_type == "calls_for_service":
-        if not request_data.get('address'):
-            return False, "Calls for service requests require a specific address"
-            
-    return True, None
+    validator = _VALIDATORS.get(report_type)
+    if validator is None:
+        return True, None
+        
+    error_msg = validator(report_type, request_data)
+    return error_msg is None, error_msg
 
 
 def prepare_phoenix_submission(
@@ -237,12 +316,8 @@ def prepare_phoenix_submission(
     Raises:
         ValueError: If validation fails
     """
-    # Combine all data
-    all_data = {
-        'case_number': case_number,
-        **requestor_info,
-        **(additional_data or {})
-    }
+    # Combined view for validation; later sources win, as in a dict merge
+    all_data = ChainMap(additional_data or {}, requestor_info, {'case_number': case_number})
     
     # Validate report type restrictions
     is_valid, error_msg = validate_report_type_restrictions(report_type, all_data)
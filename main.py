@@ -8,12 +8,14 @@ Ready to make your first $49 TODAY!
 import os
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from typing import AsyncGenerator, Optional
 from datetime import datetime
 
+import orjson
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from slowapi import _rate_limit_exceeded_handler
@@ -26,6 +28,7 @@ from proprietary.api.webhooks import router as webhook_router
 from proprietary.api.pricing_assistant import router as pricing_router
 from proprietary.database.models import Base
 from proprietary.billing.stripe_handler import StripeHandler
+from core.scrapers.phoenix_pd import PhoenixPDScraper
 
 
 # Load environment variables
@@ -38,15 +41,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Whitespace that sneaks into pasted Stripe keys
+_STRIPE_STRIP = str.maketrans('', '', ' \t\r\n\v\f')
+
+
+@dataclass(frozen=True)
+class Env:
+    """Snapshot of the environment settings the app reads at startup."""
+    database_url: Optional[str]
+    redis_url: str
+    stripe_secret_key: Optional[str]
+    stripe_webhook_secret: str
+    debug: bool
+    
+    @classmethod
+    def from_os(cls) -> "Env":
+        """Read all settings from os.environ in one pass."""
+        environ = os.environ
+        return cls(
+            database_url=environ.get("DATABASE_URL"),
+            redis_url=environ.get("REDIS_URL", "redis://localhost:6379/0"),
+            stripe_secret_key=environ.get("STRIPE_SECRET_KEY"),
+            stripe_webhook_secret=environ.get("STRIPE_WEBHOOK_SECRET", "whsec_test"),
+            debug=environ.get("DEBUG", "False").lower() == "true"
+        )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """Application lifecycle management."""
+    env = Env.from_os()
+    
     # Startup
     logger.info("=� Starting Municipal Records Processing API - Let's make money! [v2]")
     
     # Database setup
-    database_url = os.getenv("DATABASE_URL")
+    database_url = env.database_url
     # Convert postgres:// to postgresql+asyncpg:// for async support
     if database_url and database_url.startswith("postgres://"):
         database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
@@ -63,7 +93,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     engine = create_async_engine(
         database_url,
-        echo=os.getenv("DEBUG", "False").lower() == "true",
+        echo=env.debug,
         pool_size=20,
         max_overflow=0
     )
@@ -81,18 +111,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     )
     
     # Redis setup
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    redis_client = await redis.from_url(redis_url, decode_responses=True)
+    redis_client = await redis.from_url(env.redis_url, decode_responses=True)
     logger.info(" Redis connected")
     
     # Stripe setup
-    stripe_secret = os.getenv("STRIPE_SECRET_KEY")
+    stripe_secret = env.stripe_secret_key
     # Clean the API key - remove any whitespace/newlines
     if stripe_secret:
-        stripe_secret = stripe_secret.strip().replace('\n', '').replace('\r', '').replace(' ', '').replace('\t', '')
+        stripe_secret = stripe_secret.strip().translate(_STRIPE_STRIP)
         logger.info(f"Stripe key configured - length: {len(stripe_secret)}")
     
-    stripe_webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET", "whsec_test")
+    stripe_webhook_secret = env.stripe_webhook_secret
     if stripe_webhook_secret:
         stripe_webhook_secret = stripe_webhook_secret.strip()
     
@@ -105,6 +134,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         logger.info(" Stripe configured - ready to accept payments!")
     
     # Store in app state
+    app.state.env = env
     app.state.db_engine = engine
     app.state.db_session = async_session
     app.state.redis = redis_client
@@ -116,6 +146,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     # Shutdown
     logger.info("Shutting down Municipal Records Processing API")
+    try:
+        await PhoenixPDScraper.close_pool()
+    except Exception as e:
+        # Still close Redis and the database engine below
+        logger.error(f"Error closing browser pool: {e}")
     await redis_client.close()
     await engine.dispose()
 
@@ -126,6 +161,7 @@ app = FastAPI(
     description="Automated processing of public records requests. Turn 18-month waits into 48-hour turnarounds.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -150,22 +186,49 @@ app.include_router(webhook_router)
 app.include_router(pricing_router)
 
 
+class LazySession:
+    """
+    Stand-in for an AsyncSession that opens the real one on first use.
+    
+    Requests that never touch the database (/, /robots.txt, /docs, ...)
+    don't create or close a session at all.
+    """
+    
+    __slots__ = ("_factory", "_session")
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._session = None
+        
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+    
+    async def close(self) -> None:
+        """Close the underlying session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+
+
 @app.middleware("http")
 async def db_session_middleware(request: Request, call_next):
     """Add database session to request state."""
-    async with app.state.db_session() as session:
-        request.state.db = session
-        request.state.redis = app.state.redis
-        request.state.stripe = app.state.stripe
-        response = await call_next(request)
-        return response
+    session = LazySession(app.state.db_session)
+    request.state.db = session
+    request.state.redis = app.state.redis
+    request.state.stripe = app.state.stripe
+    try:
+        return await call_next(request)
+    finally:
+        await session.close()
 
 
 @app.exception_handler(500)
 async def internal_server_error_handler(request: Request, exc: Exception):
     """Handle internal server errors."""
     logger.error(f"Internal server error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "An internal error occurred. Please try again later.",
@@ -174,36 +237,38 @@ async def internal_server_error_handler(request: Request, exc: Exception):
     )
 
 
+# Static responses, serialized once at import
+_ROOT_PAYLOAD = orjson.dumps({
+    "service": "Municipal Records Processing LLC",
+    "version": "1.0.0",
+    "tagline": "Turn 18-month waits into 48-hour turnarounds",
+    "value_proposition": {
+        "problem": "Phoenix PD has 18+ month backlog for records",
+        "solution": "Automated submission in 60 seconds",
+        "price": "$49-99 per request",
+        "savings": "$2,441 per insurance claim"
+    },
+    "endpoints": {
+        "submit_request": "/api/v1/submit-request",
+        "check_status": "/api/v1/status/{request_id}",
+        "health": "/api/v1/health",
+        "documentation": "/docs"
+    },
+    "contact": "enterprise@municipalrecords.com"
+})
+_ROBOTS_TXT = b"User-agent: *\nDisallow: /\n"
+
+
 @app.get("/")
 async def root():
     """Root endpoint with revenue-focused information."""
-    return {
-        "service": "Municipal Records Processing LLC",
-        "version": "1.0.0",
-        "tagline": "Turn 18-month waits into 48-hour turnarounds",
-        "value_proposition": {
-            "problem": "Phoenix PD has 18+ month backlog for records",
-            "solution": "Automated submission in 60 seconds",
-            "price": "$49-99 per request",
-            "savings": "$2,441 per insurance claim"
-        },
-        "endpoints": {
-            "submit_request": "/api/v1/submit-request",
-            "check_status": "/api/v1/status/{request_id}",
-            "health": "/api/v1/health",
-            "documentation": "/docs"
-        },
-        "contact": "enterprise@municipalrecords.com"
-    }
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
 
 @app.get("/robots.txt", include_in_schema=False)
 async def robots():
     """Robots.txt to prevent indexing."""
-    return Response(
-        content="User-agent: *\nDisallow: /\n",
-        media_type="text/plain"
-    )
+    return Response(content=_ROBOTS_TXT, media_type="text/plain")
 
 
 if __name__ == "__main__":
@@ -2,10 +2,28 @@
 """Open the order form in browser"""
 
 import webbrowser
+import functools
 import os
+import shutil
 import subprocess
 import platform
 
+
+@functools.lru_cache(maxsize=None)
+def _is_wsl():
+    """Whether we're running under WSL (checked once)."""
+    return 'microsoft' in platform.uname().release.lower()
+
+
+@functools.lru_cache(maxsize=None)
+def _windows_path(path):
+    """Translate a WSL path for Windows, spawning wslpath once per path."""
+    return subprocess.check_output(['wslpath', '-w', path]).decode().strip()
+
+
+# Looked up once; None falls back to webbrowser
+XDG_OPEN = shutil.which('xdg-open')
+
 # Get the absolute path
 order_form = os.path.abspath("municipal-records-website/order.html")
 
@@ -14,13 +32,18 @@ print(f"📁 File location: {order_form}")
 
 # Try different methods to open
 try:
+    # Native Windows: hand the file to the shell without spawning a process
+    if platform.system() == 'Windows':
+        os.startfile(order_form)
     # For WSL, try to open with Windows browser
-    if 'microsoft' in platform.uname().release.lower():
-        windows_path = subprocess.check_output(['wslpath', '-w', order_form]).decode().strip()
+    elif _is_wsl():
+        windows_path = _windows_path(order_form)
         print(f"🪟 Windows path: {windows_path}")
         subprocess.run(['cmd.exe', '/c', 'start', windows_path])
+    # For regular Linux, hand the file straight to xdg-open
+    elif XDG_OPEN:
+        subprocess.Popen([XDG_OPEN, order_form])
     else:
-        # For regular Linux
         webbrowser.open(f'file://{order_form}')
     
     print("\n✅ Browser should be opening...")
@@ -5,39 +5,58 @@ Handles pricing inquiries, applies discounts, and creates payment links.
 """
 
 import anthropic
-from typing import Dict, List, Optional, Any
+import asyncio
+import inspect
+from typing import AsyncIterator, Dict, List, Optional, Any
 import json
 import logging
+import os
+import orjson
 from datetime import datetime
-import importlib
 
 from .claude_tools_config import (
     STRIPE_PRICING_TOOLS,
     PRICING_AGENT_SYSTEM_PROMPT,
     SALES_AGENT_SYSTEM_PROMPT,
     SUPPORT_AGENT_SYSTEM_PROMPT,
-    TOOL_FUNCTION_MAP
+    TOOL_FUNCTION_MAP,
+    TOOL_CALLABLES,
+    resolve_tool
 )
+from .response_cache import PricingResponseCache
 
 logger = logging.getLogger(__name__)
 
+CLAUDE_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-3-7-sonnet-20250219")
+
+# Token-efficient tool use trims output tokens on tool calls; prompt caching
+# reuses the tools + system prompt prefix marked in claude_tools_config
+ANTHROPIC_BETAS = ["token-efficient-tools-2025-02-19", "prompt-caching-2024-07-31"]
+
 
 class PricingAgent:
     """AI-powered pricing assistant using Claude."""
     
-    def __init__(self, api_key: str, agent_type: str = "pricing"):
+    def __init__(
+        self,
+        api_key: str,
+        agent_type: str = "pricing",
+        cache: Optional[PricingResponseCache] = None
+    ):
         """
         Initialize the pricing agent.
         
         Args:
             api_key: Anthropic API key
             agent_type: Type of agent ('pricing', 'sales', 'support')
+            cache: Cache for answers to first-turn questions (default: none)
         """
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(api_key=api_key)
         self.agent_type = agent_type
+        self.cache = cache
         self.system_prompt = self._get_system_prompt(agent_type)
         
-    def _get_system_prompt(self, agent_type: str) -> str:
+    def _get_system_prompt(self, agent_type: str) -> List[Dict[str, Any]]:
         """Get the appropriate system prompt based on agent type."""
         prompts = {
             "pricing": PRICING_AGENT_SYSTEM_PROMPT,
@@ -64,11 +83,196 @@ class PricingAgent:
             Dictionary with response and any actions taken
         """
         
+        cache_key = self._cache_key(customer_query, customer_data, conversation_history)
+        if cache_key:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+                
         # Build message context
         messages = conversation_history or []
         
         # Add customer context
-        context_message = {
+        messages.append(self._context_message(customer_query, customer_data))
+        
+        try:
+            # Get Claude's response
+            response = await self.client.beta.messages.create(
+                **self._request_params(messages),
+                betas=ANTHROPIC_BETAS
+            )
+            
+            # Process the response
+            result = {
+                "success": True,
+                "response": "",
+                "actions": [],
+                "tool_results": []
+            }
+            
+            # Handle tool use
+            if response.stop_reason == "tool_use":
+                await self._run_tool_calls(response, customer_data, result)
+                
+                # Get Claude's final response after tool execution
+                messages.extend(self._tool_followup(response, result["tool_results"]))
+                
+                # Get final response
+                final_response = await self.client.beta.messages.create(
+                    **self._request_params(messages),
+                    betas=ANTHROPIC_BETAS
+                )
+                
+                result["response"] = self._response_text(final_response)
+                
+            else:
+                # Direct response without tool use
+                result["response"] = self._response_text(response)
+                
+                if cache_key:
+                    await self.cache.set(cache_key, result, customer_data.get("stripe_id"))
+                    
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error in pricing agent: {str(e)}")
+            return self._error_result(e)
+            
+    async def stream_pricing_request(
+        self,
+        customer_query: str,
+        customer_data: Dict[str, Any],
+        conversation_history: Optional[List[Dict]] = None,
+        result: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Process a pricing request, yielding response text as Claude writes it.
+        
+        Tool calls are executed between the two model turns as in
+        handle_pricing_request; only the text is streamed.
+        
+        Args:
+            customer_query: The customer's question or request
+            customer_data: Customer information including usage data
+            conversation_history: Previous messages in the conversation
+            result: Optional dict filled in with the full response and any
+                actions taken, once the stream is exhausted
+            
+        Yields:
+            Chunks of response text
+        """
+        if result is None:
+            result = {}
+        result.update({
+            "success": True,
+            "response": "",
+            "actions": [],
+            "tool_results": []
+        })
+        
+        cache_key = self._cache_key(customer_query, customer_data, conversation_history)
+        if cache_key:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                result.update(cached)
+                yield result["response"]
+                return
+                
+        messages = conversation_history or []
+        messages.append(self._context_message(customer_query, customer_data))
+        
+        try:
+            chunks = []
+            turn = {}
+            
+            # First turn: stream any text Claude writes before calling tools
+            async for text in self._stream_turn(messages, turn):
+                chunks.append(text)
+                yield text
+            response = turn["message"]
+                
+            # Handle tool use, then stream the final response
+            if response.stop_reason == "tool_use":
+                await self._run_tool_calls(response, customer_data, result)
+                messages.extend(self._tool_followup(response, result["tool_results"]))
+                
+                async for text in self._stream_turn(messages, turn):
+                    chunks.append(text)
+                    yield text
+                    
+            result["response"] = "".join(chunks)
+            
+            if cache_key and not result["actions"]:
+                await self.cache.set(cache_key, result, customer_data.get("stripe_id"))
+                
+        except Exception as e:
+            logger.error(f"Error in pricing agent stream: {str(e)}")
+            result.update(self._error_result(e))
+            yield result["response"]
+            
+    async def _stream_turn(self, messages: List[Dict], turn: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream one model turn, yielding text as it arrives.
+        
+        The pinned SDK's beta client has no messages.stream() helper, so this
+        reads the raw create(stream=True) events and stores the assembled
+        message, tool_use inputs included, under turn["message"].
+        """
+        stream = await self.client.beta.messages.create(
+            **self._request_params(messages),
+            betas=ANTHROPIC_BETAS,
+            stream=True
+        )
+        
+        message = None
+        stop_reason = None
+        blocks = {}
+        texts = {}
+        tool_inputs = {}
+        
+        async for event in stream:
+            if event.type == "message_start":
+                message = event.message
+            elif event.type == "content_block_start":
+                blocks[event.index] = event.content_block
+            elif event.type == "content_block_delta":
+                if event.delta.type == "text_delta":
+                    texts.setdefault(event.index, []).append(event.delta.text)
+                    yield event.delta.text
+                elif event.delta.type == "input_json_delta":
+                    tool_inputs.setdefault(event.index, []).append(event.delta.partial_json)
+            elif event.type == "message_delta":
+                stop_reason = event.delta.stop_reason
+                
+        for index, parts in texts.items():
+            blocks[index] = blocks[index].model_copy(update={"text": "".join(parts)})
+        for index, parts in tool_inputs.items():
+            blocks[index] = blocks[index].model_copy(update={"input": json.loads("".join(parts) or "{}")})
+            
+        turn["message"] = message.model_copy(update={
+            "content": [blocks[index] for index in sorted(blocks)],
+            "stop_reason": stop_reason
+        })
+        
+    def _cache_key(
+        self,
+        customer_query: str,
+        customer_data: Dict[str, Any],
+        conversation_history: Optional[List[Dict]]
+    ) -> Optional[str]:
+        """
+        Get the response cache key for a request, or None if it can't be cached.
+        
+        Only opening questions are cached: later turns depend on the
+        conversation so far.
+        """
+        if self.cache is None or conversation_history:
+            return None
+        return self.cache.make_key(self.agent_type, customer_query, customer_data)
+        
+    def _context_message(self, customer_query: str, customer_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the user message carrying the query and customer context."""
+        return {
             "role": "user",
             "content": f"""
 Customer query: {customer_query}
@@ -86,81 +290,205 @@ Current date: {datetime.now().strftime('%Y-%m-%d')}
 """
         }
         
-        messages.append(context_message)
+    def _request_params(self, messages: List[Dict]) -> Dict[str, Any]:
+        """
+        Build the Messages API parameters for a conversation.
         
-        try:
-            # Get Claude's response
-            response = self.client.messages.create(
-                model="claude-3-sonnet-20240229",
-                max_tokens=1000,
-                temperature=0,
-                system=self.system_prompt,
-                messages=messages,
-                tools=STRIPE_PRICING_TOOLS
+        Tools are always sent: the API requires them whenever the history
+        holds tool_use blocks, and an unchanged prefix keeps the prompt
+        cache warm.
+        """
+        return {
+            "model": CLAUDE_MODEL,
+            "max_tokens": 1000,
+            "temperature": 0,
+            "system": self.system_prompt,
+            "messages": messages,
+            "tools": STRIPE_PRICING_TOOLS
+        }
+        
+    @staticmethod
+    def _response_text(response) -> str:
+        """Get the text of a response, skipping any tool_use blocks."""
+        return "".join(block.text for block in response.content if block.type == "text")
+        
+    async def _run_tool_calls(
+        self,
+        response,
+        customer_data: Dict[str, Any],
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Execute every tool call in a response concurrently.
+        
+        Results are recorded on result in the order Claude requested them.
+        """
+        tool_calls = [content for content in response.content if content.type == "tool_use"]
+        tool_results = await asyncio.gather(*(
+            self._execute_tool(
+                tool_name=content.name,
+                tool_input=content.input,
+                customer_data=customer_data
             )
+            for content in tool_calls
+        ))
+        
+        for content, tool_result in zip(tool_calls, tool_results):
+            result["tool_results"].append(tool_result)
+            result["actions"].append({
+                "tool": content.name,
+                "input": content.input,
+                "result": tool_result
+            })
             
-            # Process the response
+    def _tool_followup(self, response, tool_results: List[Dict[str, Any]]) -> List[Dict]:
+        """Build the messages that hand tool results back to Claude."""
+        tool_calls = [content for content in response.content if content.type == "tool_use"]
+        return [
+            {
+                "role": "assistant",
+                "content": [block.model_dump() for block in response.content]
+            },
+            {
+                # One tool_result per tool_use, paired by id
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": content.id,
+                        "content": json.dumps(tool_result)
+                    }
+                    for content, tool_result in zip(tool_calls, tool_results)
+                ]
+            }
+        ]
+        
+    def _error_result(self, error: Any) -> Dict[str, Any]:
+        """Build the customer-facing result for a failed request."""
+        return {
+            "success": False,
+            "error": str(error),
+            "response": "I apologize, but I encountered an error processing your request. Please try again or contact support@municipalrecordsprocessing.com for assistance."
+        }
+        
+    async def handle_pricing_request_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        poll_interval: float = 30.0
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Process non-interactive pricing requests through the Message Batches API.
+        
+        Batches are billed at half the interactive rate but can take minutes
+        to hours, so use this for offline work (savings analyses, credit
+        sweeps, re-pricing) and handle_pricing_request for live chat.
+        
+        Args:
+            jobs: Requests, each with "id", "query" and "customer_data" keys
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Dictionary mapping each job id to a handle_pricing_request-style result
+        """
+        # Batch custom_ids are restricted, so key by position and map back
+        conversations = {}
+        for index, job in enumerate(jobs):
+            conversations[f"job-{index}"] = [
+                self._context_message(job["query"], job.get("customer_data", {}))
+            ]
+            
+        responses = await self._run_batch({
+            custom_id: self._request_params(messages)
+            for custom_id, messages in conversations.items()
+        }, poll_interval)
+        
+        results = {}
+        followups = {}
+        tool_jobs = []
+        
+        for index, job in enumerate(jobs):
+            custom_id = f"job-{index}"
+            response = responses.get(custom_id)
+            if isinstance(response, Exception) or response is None:
+                results[custom_id] = self._error_result(response or "No result returned")
+                continue
+                
             result = {
                 "success": True,
                 "response": "",
                 "actions": [],
                 "tool_results": []
             }
+            results[custom_id] = result
             
-            # Handle tool use
             if response.stop_reason == "tool_use":
-                for content in response.content:
-                    if content.type == "tool_use":
-                        tool_result = await self._execute_tool(
-                            tool_name=content.name,
-                            tool_input=content.input,
-                            customer_data=customer_data
-                        )
-                        result["tool_results"].append(tool_result)
-                        result["actions"].append({
-                            "tool": content.name,
-                            "input": content.input,
-                            "result": tool_result
-                        })
-                        
-                # Get Claude's final response after tool execution
-                messages.append({
-                    "role": "assistant",
-                    "content": response.content
-                })
-                
-                # Add tool results
-                for tool_result in result["tool_results"]:
-                    messages.append({
-                        "role": "user",
-                        "content": f"Tool result: {json.dumps(tool_result)}"
-                    })
-                
-                # Get final response
-                final_response = self.client.messages.create(
-                    model="claude-3-sonnet-20240229",
-                    max_tokens=1000,
-                    temperature=0,
-                    system=self.system_prompt,
-                    messages=messages
-                )
-                
-                result["response"] = final_response.content[0].text
-                
+                tool_jobs.append((custom_id, job, response))
             else:
-                # Direct response without tool use
-                result["response"] = response.content[0].text
+                result["response"] = self._response_text(response)
                 
-            return result
+        # Run every job's tool calls concurrently, then ask for the final
+        # answers in a second batch
+        async def run_tools(custom_id, job, response):
+            result = results[custom_id]
+            await self._run_tool_calls(response, job.get("customer_data", {}), result)
+            followups[custom_id] = self._request_params(
+                conversations[custom_id] + self._tool_followup(response, result["tool_results"])
+            )
             
-        except Exception as e:
-            logger.error(f"Error in pricing agent: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "response": "I apologize, but I encountered an error processing your request. Please try again or contact support@municipalrecordsprocessing.com for assistance."
-            }
+        await asyncio.gather(*(run_tools(*tool_job) for tool_job in tool_jobs))
+        
+        if followups:
+            final_responses = await self._run_batch(followups, poll_interval)
+            for custom_id in followups:
+                response = final_responses.get(custom_id)
+                if isinstance(response, Exception) or response is None:
+                    results[custom_id].update(self._error_result(response or "No result returned"))
+                else:
+                    results[custom_id]["response"] = self._response_text(response)
+                    
+        return {
+            job.get("id", index): results[f"job-{index}"]
+            for index, job in enumerate(jobs)
+        }
+        
+    async def _run_batch(
+        self,
+        requests: Dict[str, Dict[str, Any]],
+        poll_interval: float
+    ) -> Dict[str, Any]:
+        """
+        Submit a message batch and wait for it to finish.
+        
+        Args:
+            requests: Messages API parameters keyed by custom_id
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Dictionary mapping custom_id to the Message, or to an exception
+            for requests that errored, expired or were canceled
+        """
+        batches = self.client.beta.messages.batches
+        batch = await batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": params}
+                for custom_id, params in requests.items()
+            ],
+            betas=ANTHROPIC_BETAS
+        )
+        logger.info(f"Submitted pricing batch {batch.id} with {len(requests)} requests")
+        
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await batches.retrieve(batch.id, betas=ANTHROPIC_BETAS)
             
+        responses = {}
+        async for entry in await batches.results(batch.id, betas=ANTHROPIC_BETAS):
+            if entry.result.type == "succeeded":
+                responses[entry.custom_id] = entry.result.message
+            else:
+                responses[entry.custom_id] = RuntimeError(f"Batch request {entry.result.type}")
+        return responses
+        
     async def _execute_tool(
         self, 
         tool_name: str, 
@@ -179,22 +507,24 @@ Current date: {datetime.now().strftime('%Y-%m-%d')}
             Tool execution result
         """
         try:
-            # Get the function path
-            function_path = TOOL_FUNCTION_MAP.get(tool_name)
-            if not function_path:
-                return {"error": f"Unknown tool: {tool_name}"}
-                
-            # Import and execute the function
-            module_path, function_name = function_path.rsplit(".", 1)
-            module = importlib.import_module(module_path)
-            function = getattr(module, function_name)
+            function = TOOL_CALLABLES.get(tool_name)
+            if function is None:
+                # Not loaded at startup: fall back to importing it now
+                function_path = TOOL_FUNCTION_MAP.get(tool_name)
+                if not function_path:
+                    return {"error": f"Unknown tool: {tool_name}"}
+                function = TOOL_CALLABLES[tool_name] = resolve_tool(function_path)
             
             # Add customer email if available and not provided
             if tool_name == "create_prepaid_package" and "customer_email" not in tool_input:
                 tool_input["customer_email"] = customer_data.get("email")
                 
-            # Execute the function
-            result = function(**tool_input)
+            # Execute the function; blocking Stripe calls run in a thread so
+            # concurrent tool calls don't serialize on the event loop
+            if inspect.iscoroutinefunction(function):
+                result = await function(**tool_input)
+            else:
+                result = await asyncio.to_thread(function, **tool_input)
             
             # Log the action
             logger.info(f"Executed tool {tool_name} for customer {customer_data.get('stripe_id', 'unknown')}")
@@ -259,31 +589,54 @@ Would you like me to help you set up a prepaid package to maximize your savings?
 
 
 class ConversationManager:
-    """Manages conversation state for multi-turn interactions."""
+    """
+    Manages conversation state for multi-turn interactions.
     
-    def __init__(self):
-        self.conversations = {}
+    History lives in Redis so it is shared across workers and survives
+    restarts; each session is a capped list that expires when idle.
+    """
+    
+    # Keep only the last 10 messages to manage context window
+    MAX_MESSAGES = 10
+    TTL_SECONDS = 3600
+    
+    def __init__(self, redis):
+        """
+        Initialize the conversation manager.
+        
+        Args:
+            redis: redis.asyncio client
+        """
+        self.redis = redis
         
-    def get_conversation(self, session_id: str) -> List[Dict]:
-        """Get conversation history for a session."""
-        return self.conversations.get(session_id, [])
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"pricing:session:{session_id}"
         
-    def add_message(self, session_id: str, role: str, content: str):
+    async def get_conversation(self, session_id: str) -> List[Dict]:
+        """Get conversation history for a session, as Claude messages."""
+        stored = await self.redis.lrange(self._key(session_id), 0, -1)
+        return [
+            {"role": message["role"], "content": message["content"]}
+            for message in map(orjson.loads, stored)
+        ]
+        
+    async def add_message(self, session_id: str, role: str, content: str):
         """Add a message to the conversation history."""
-        if session_id not in self.conversations:
-            self.conversations[session_id] = []
-            
-        self.conversations[session_id].append({
+        key = self._key(session_id)
+        message = orjson.dumps({
             "role": role,
             "content": content,
             "timestamp": datetime.utcnow().isoformat()
         })
         
-        # Keep only last 10 messages to manage context window
-        if len(self.conversations[session_id]) > 10:
-            self.conversations[session_id] = self.conversations[session_id][-10:]
+        # Append, cap and refresh the TTL in one round trip
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, message)
+            pipe.ltrim(key, -self.MAX_MESSAGES, -1)
+            pipe.expire(key, self.TTL_SECONDS)
+            await pipe.execute()
             
-    def clear_conversation(self, session_id: str):
+    async def clear_conversation(self, session_id: str):
         """Clear conversation history for a session."""
-        if session_id in self.conversations:
-            del self.conversations[session_id]
\ No newline at end of file
+        await self.redis.delete(self._key(session_id))
@@ -4,6 +4,11 @@ Claude AI tool configurations for pricing automation.
 Defines the tools available to Claude for managing customer pricing.
 """
 
+import importlib
+import logging
+
+logger = logging.getLogger(__name__)
+
 STRIPE_PRICING_TOOLS = [
     {
         "name": "update_volume_pricing",
@@ -76,12 +81,17 @@ STRIPE_PRICING_TOOLS = [
                 }
             },
             "required": ["customer_id", "order_count"]
-        }
+        },
+        # Cache breakpoint: the tool definitions are identical for every agent
+        "cache_control": {"type": "ephemeral"}
     }
 ]
 
-# System prompts for different contexts
-PRICING_AGENT_SYSTEM_PROMPT = """
+# System prompts for different contexts, as cacheable system blocks. The
+# breakpoint on each prompt caches the tools + system prefix across turns.
+PRICING_AGENT_SYSTEM_PROMPT = [{
+    "type": "text",
+    "text": """
 You are a helpful pricing specialist for Municipal Records Processing LLC.
 
 Our automated pricing model:
@@ -103,9 +113,13 @@ Key points to emphasize:
 5. Phoenix PD fees ($5) are separate and passed through at cost
 
 Always be helpful, friendly, and focus on value/savings. When customers ask about pricing, check their current usage and suggest the most cost-effective option.
-"""
+""",
+    "cache_control": {"type": "ephemeral"}
+}]
 
-SALES_AGENT_SYSTEM_PROMPT = """
+SALES_AGENT_SYSTEM_PROMPT = [{
+    "type": "text",
+    "text": """
 You are a sales specialist for Municipal Records Processing LLC helping potential customers understand our pricing.
 
 Key selling points:
@@ -122,9 +136,13 @@ Pricing:
 
 Always ask about their monthly volume to provide accurate pricing.
 Focus on ROI - each delayed report costs ~$2,400 in insurance claims.
-"""
+""",
+    "cache_control": {"type": "ephemeral"}
+}]
 
-SUPPORT_AGENT_SYSTEM_PROMPT = """
+SUPPORT_AGENT_SYSTEM_PROMPT = [{
+    "type": "text",
+    "text": """
 You are a customer support specialist for Municipal Records Processing LLC.
 
 Common questions and answers:
@@ -145,7 +163,9 @@ Q: How fast is the service?
 A: Submission within 60 seconds. Phoenix PD typically processes in 48-72 hours.
 
 Be empathetic, helpful, and solution-oriented. If unsure, offer to escalate to a human specialist.
-"""
+""",
+    "cache_control": {"type": "ephemeral"}
+}]
 
 # Tool execution mapping
 TOOL_FUNCTION_MAP = {
@@ -153,4 +173,25 @@ TOOL_FUNCTION_MAP = {
     "create_prepaid_package": "proprietary.integrations.stripe_tools.create_prepaid_credit_package",
     "calculate_savings": "proprietary.integrations.stripe_tools.calculate_customer_savings",
     "apply_retroactive_credit": "proprietary.integrations.stripe_tools.apply_retroactive_discount"
-}
\ No newline at end of file
+}
+
+
+def resolve_tool(function_path: str):
+    """Import the function behind a TOOL_FUNCTION_MAP entry."""
+    module_path, function_name = function_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), function_name)
+
+
+def _resolve_tools():
+    """Resolve every tool once; tools that fail are resolved on first use."""
+    callables = {}
+    for name, function_path in TOOL_FUNCTION_MAP.items():
+        try:
+            callables[name] = resolve_tool(function_path)
+        except Exception as e:
+            logger.warning(f"Could not load tool {name}: {e}")
+    return callables
+
+
+# Tool name -> function, so tool calls don't go through the import system
+TOOL_CALLABLES = _resolve_tools()
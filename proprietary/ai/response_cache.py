@@ -0,0 +1,168 @@
+"""
+Two-tier cache for pricing assistant answers.
+
+Pricing questions are answered at temperature 0 from a handful of customer
+fields, so a customer asking the same opening question again gets the same
+answer. Caching those answers skips both Claude round trips.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_WS_RE = re.compile(r"\s+")
+
+
+class PricingResponseCache:
+    """
+    In-process TTL cache backed by Redis.
+    
+    The in-process tier is shared by every instance in a worker; Redis
+    shares answers across workers and keeps them longer. Answers are
+    per customer, and Redis keeps an index of each customer's keys so
+    they can be dropped when the customer's pricing changes.
+    """
+    
+    # key -> (expires_at, result)
+    _local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    def __init__(
+        self,
+        redis=None,
+        ttl: int = 3600,
+        local_ttl: float = 60,
+        local_maxsize: int = 1000
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            redis: redis.asyncio client, or None for in-process caching only
+            ttl: Seconds an answer stays in Redis
+            local_ttl: Seconds an answer stays in process memory
+            local_maxsize: Maximum answers kept in process memory
+        """
+        self.redis = redis
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.local_maxsize = local_maxsize
+    
+    @staticmethod
+    def make_key(agent_type: str, query: str, customer_data: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a query.
+        
+        Covers every customer field the prompt carries, so an answer, which
+        may quote the customer's ID, email or usage, is only ever served
+        back to the same customer in the same state.
+        """
+        fields = {
+            "agent_type": agent_type,
+            "query": _WS_RE.sub(" ", query).strip().lower(),
+            "customer_id": customer_data.get("stripe_id"),
+            "email": customer_data.get("email"),
+            "monthly_usage": customer_data.get("monthly_usage") or 0,
+            "total_requests": customer_data.get("total_requests") or 0,
+            "credits_balance": customer_data.get("credits_balance") or 0,
+            "tier": customer_data.get("current_tier", "standard"),
+            "account_type": customer_data.get("account_type", "standard")
+        }
+        digest = hashlib.blake2b(
+            orjson.dumps(fields, option=orjson.OPT_SORT_KEYS),
+            digest_size=16
+        ).hexdigest()
+        return f"pricing:answer:{digest}"
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached answer, checking process memory before Redis."""
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                return result
+            del self._local[key]
+        
+        if self.redis is None:
+            return None
+        
+        try:
+            stored = await self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Pricing cache lookup failed: {e}")
+            return None
+        
+        if stored is None:
+            return None
+        
+        result = orjson.loads(stored)
+        self._store_local(key, result)
+        return result
+    
+    async def set(
+        self,
+        key: str,
+        result: Dict[str, Any],
+        customer_id: Optional[str] = None
+    ) -> None:
+        """
+        Cache an answer in both tiers.
+        
+        Args:
+            key: Key from make_key
+            result: Answer to cache
+            customer_id: Stripe customer ID to index the answer under, so
+                invalidate_customer can drop it
+        """
+        self._store_local(key, result)
+        
+        if self.redis is None:
+            return
+        
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.setex(key, self.ttl, orjson.dumps(result))
+                if customer_id:
+                    index = self._index_key(customer_id)
+                    pipe.sadd(index, key)
+                    pipe.expire(index, self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Pricing cache store failed: {e}")
+    
+    async def invalidate_customer(self, customer_id: str) -> None:
+        """
+        Drop every cached answer for a customer, e.g. after a tier change.
+        
+        Other workers' in-process copies expire within local_ttl.
+        """
+        if self.redis is None or not customer_id:
+            return
+        
+        index = self._index_key(customer_id)
+        try:
+            keys = await self.redis.smembers(index)
+            await self.redis.delete(index, *keys)
+        except Exception as e:
+            logger.warning(f"Pricing cache invalidation failed: {e}")
+            return
+        
+        for key in keys:
+            self._local.pop(key, None)
+    
+    @staticmethod
+    def _index_key(customer_id: str) -> str:
+        return f"pricing:answers:{customer_id}"
+    
+    def _store_local(self, key: str, result: Dict[str, Any]) -> None:
+        self._local[key] = (time.monotonic() + self.local_ttl, result)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_maxsize:
+            self._local.popitem(last=False)
@@ -6,13 +6,18 @@ Revenue-generating endpoints for submitting and tracking requests.
 
 from datetime import datetime
 from typing import Optional, List
+import hashlib
 import logging
+import time
 import uuid
 
-from fastapi import APIRouter, HTTPException, Request, Depends, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, Depends, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -24,7 +29,7 @@ from ..database.models import (
     RequestEvent,
     ReportType
 )
-from ..auth.api_key import verify_api_key
+from ..auth.api_key import verify_api_key, lookup_api_key
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +72,33 @@ class RequestStatusResponse(BaseModel):
     document_urls: Optional[List[str]]
 
 
+async def _upsert_customer(db: AsyncSession, **values) -> Customer:
+    """
+    Get the customer with an email address, creating them if needed.
+    
+    Runs as a single INSERT ... ON CONFLICT (email) ... RETURNING, so
+    concurrent requests for a new email can't race. An existing customer is
+    returned unchanged; values only apply to a new row.
+    
+    Args:
+        db: Database session
+        **values: Column values for a new customer, including email
+        
+    Returns:
+        Customer
+    """
+    insert = sqlite_insert if db.bind.dialect.name == "sqlite" else postgresql_insert
+    stmt = insert(Customer).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Customer.email],
+        # No-op update so RETURNING also yields the existing row
+        set_={"email": stmt.excluded.email}
+    ).returning(Customer)
+    
+    result = await db.execute(stmt, execution_options={"populate_existing": True})
+    return result.scalar_one()
+
+
 @router.post("/submit-request", response_model=dict)
 @limiter.limit("10/minute")
 async def submit_request(
@@ -106,28 +138,21 @@ async def submit_request(
             )
         
         # Find or create customer
-        customer_result = await db.execute(
-            select(Customer).where(Customer.email == data.requestor_email)
+        customer = await _upsert_customer(
+            db,
+            email=data.requestor_email,
+            first_name=data.requestor_first_name,
+            last_name=data.requestor_last_name,
+            phone=data.requestor_phone,
+            tier="standard",
+            credits_balance=0
         )
-        customer = customer_result.scalar_one_or_none()
-        
-        if not customer:
-            # Create new customer
-            customer = Customer(
-                email=data.requestor_email,
-                first_name=data.requestor_first_name,
-                last_name=data.requestor_last_name,
-                phone=data.requestor_phone,
-                tier="standard",
-                credits_balance=0
-            )
-            db.add(customer)
-            await db.flush()  # Get the customer ID
         
-        # Create request record
+        # Create request record; the relationships let SQLAlchemy fill in
+        # the foreign keys without a flush per row
         db_request = DBRequest(
             request_id=request_id,
-            customer_id=customer.id,
+            customer=customer,
             report_type=report_type_enum,
             case_number=data.case_number,
             requestor_email=data.requestor_email,
@@ -139,12 +164,9 @@ async def submit_request(
             source="api"
         )
         
-        db.add(db_request)
-        await db.flush()  # Get the auto-generated ID
-        
         # Create initial event
         event = RequestEvent(
-            request_id=db_request.id,
+            request=db_request,
             event_type="request_created",
             event_data={
                 "report_type": data.report_type,
@@ -152,8 +174,10 @@ async def submit_request(
             },
             triggered_by="api"
         )
-        db.add(event)
+        db.add_all([db_request, event])
         
+        # Commit before calling Stripe so neither the customer row lock
+        # from the upsert nor a pooled connection is held across the call
         await db.commit()
         
         # Determine amount based on test mode
@@ -185,16 +209,24 @@ async def submit_request(
                 logger.warning(f"Test mode: Stripe payment link creation failed but continuing")
                 payment_url = f"https://checkout.stripe.com/test/pay/{request_id}"
             else:
+                # The request is already stored; close it out
+                db_request.status = RequestStatus.CANCELLED
+                db.add(RequestEvent(
+                    request=db_request,
+                    event_type="payment_link_failed",
+                    event_data={"error": payment_result.get("error")},
+                    triggered_by="api"
+                ))
+                await db.commit()
                 raise HTTPException(
                     status_code=500,
                     detail="Failed to create payment link"
                 )
         else:
             payment_url = payment_result["url"]
-            # Update request with payment info
+            # Update request with payment info in a second, short transaction
             db_request.stripe_checkout_session_id = payment_result.get("session_id")
-        
-        await db.commit()
+            await db.commit()
         
         logger.info(f"Created request {request_id} with payment link")
         
@@ -246,12 +278,9 @@ async def get_request_status(
     # Check authorization (either API key or matching email)
     if api_key:
         # Verify API key belongs to request owner
-        customer_result = await db.execute(
-            select(Customer).where(Customer.api_key == api_key)
-        )
-        customer = customer_result.scalar_one_or_none()
+        customer = await lookup_api_key(api_key, db, request.state.redis)
         
-        if not customer or customer.email != db_request.requestor_email:
+        if not customer or customer[1] != db_request.requestor_email:
             raise HTTPException(
                 status_code=403,
                 detail="Not authorized to view this request"
@@ -290,6 +319,20 @@ async def get_request_status(
     return response
 
 
+# Request total reported by /health, as [refresh_at, count]
+_REQUEST_COUNT_TTL = 30
+_request_count = [0.0, 0]
+
+
+async def _total_requests(db: AsyncSession) -> int:
+    """Count requests, re-running the count at most every 30 seconds."""
+    now = time.monotonic()
+    if now >= _request_count[0]:
+        result = await db.execute(select(func.count(DBRequest.id)))
+        _request_count[:] = [now + _REQUEST_COUNT_TTL, result.scalar()]
+    return _request_count[1]
+
+
 @router.get("/health")
 async def health_check(request: Request):
     """
@@ -300,8 +343,8 @@ async def health_check(request: Request):
     try:
         # Check database
         db: AsyncSession = request.state.db
-        result = await db.execute(select(func.count(DBRequest.id)))
-        request_count = result.scalar()
+        await db.execute(select(1))
+        request_count = await _total_requests(db)
         
         # Check Redis
         redis = request.state.redis
@@ -327,64 +370,78 @@ async def health_check(request: Request):
         )
 
 
+# Pricing is static, so serialize it once and let clients revalidate by ETag
+_PRICING_BYTES = orjson.dumps({
+    "base_price": 49.00,
+    "currency": "USD",
+    "volume_discounts": {
+        "11-50": {
+            "discount": "20%",
+            "price": 39.20
+        },
+        "51-100": {
+            "discount": "40%", 
+            "price": 29.40
+        },
+        "100+": {
+            "discount": "60%",
+            "price": 19.60
+        }
+    },
+    "prepaid_packages": [
+        {
+            "name": "Starter",
+            "credits": 12,
+            "price": 500,
+            "savings": 88
+        },
+        {
+            "name": "Professional",
+            "credits": 60,
+            "price": 2000,
+            "savings": 940
+        },
+        {
+            "name": "Enterprise",
+            "credits": 200,
+            "price": 5000,
+            "savings": 4800
+        }
+    ],
+    "phoenix_pd_fees": {
+        "incident_report": 5.00,
+        "traffic_crash": 5.00,
+        "body_camera": 4.00,
+        "surveillance": 4.00,
+        "recordings_911": 16.50
+    },
+    "notes": [
+        "Prices in USD",
+        "Phoenix PD fees are passed through at cost",
+        "Volume discounts apply automatically",
+        "Credits never expire"
+    ]
+})
+_PRICING_ETAG = f'"{hashlib.blake2b(_PRICING_BYTES, digest_size=8).hexdigest()}"'
+_PRICING_HEADERS = {"ETag": _PRICING_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
 @router.get("/pricing")
-async def get_pricing():
+async def get_pricing(request: Request):
     """
     Get current pricing information.
     
     Returns base pricing and volume discounts.
     """
-    return {
-        "base_price": 49.00,
-        "currency": "USD",
-        "volume_discounts": {
-            "11-50": {
-                "discount": "20%",
-                "price": 39.20
-            },
-            "51-100": {
-                "discount": "40%", 
-                "price": 29.40
-            },
-            "100+": {
-                "discount": "60%",
-                "price": 19.60
-            }
-        },
-        "prepaid_packages": [
-            {
-                "name": "Starter",
-                "credits": 12,
-                "price": 500,
-                "savings": 88
-            },
-            {
-                "name": "Professional",
-                "credits": 60,
-                "price": 2000,
-                "savings": 940
-            },
-            {
-                "name": "Enterprise",
-                "credits": 200,
-                "price": 5000,
-                "savings": 4800
-            }
-        ],
-        "phoenix_pd_fees": {
-            "incident_report": 5.00,
-            "traffic_crash": 5.00,
-            "body_camera": 4.00,
-            "surveillance": 4.00,
-            "recordings_911": 16.50
-        },
-        "notes": [
-            "Prices in USD",
-            "Phoenix PD fees are passed through at cost",
-            "Volume discounts apply automatically",
-            "Credits never expire"
-        ]
-    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if _PRICING_ETAG in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=_PRICING_HEADERS)
+        
+    return Response(
+        content=_PRICING_BYTES,
+        media_type="application/json",
+        headers=_PRICING_HEADERS
+    )
 
 
 @router.post("/customer/register")
@@ -400,36 +457,29 @@ async def register_customer(
     """
     db: AsyncSession = request.state.db
     
-    # Check if customer exists
-    result = await db.execute(
-        select(Customer).where(Customer.email == email)
-    )
-    existing = result.scalar_one_or_none()
-    
-    if existing:
-        return {
-            "success": True,
-            "message": "Customer already registered",
-            "api_key": existing.api_key,
-            "created_at": existing.created_at
-        }
-    
     # Generate API key
     from ..billing.stripe_handler import StripeHandler
     api_key = StripeHandler.generate_api_key()
     
-    # Create customer
-    customer = Customer(
+    # Create customer, or get the existing one
+    customer = await _upsert_customer(
+        db,
         email=email,
         company_name=company_name,
         api_key=api_key,
         credits_balance=0,
         tier="standard"
     )
-    
-    db.add(customer)
     await db.commit()
     
+    if customer.api_key != api_key:
+        return {
+            "success": True,
+            "message": "Customer already registered",
+            "api_key": customer.api_key,
+            "created_at": customer.created_at
+        }
+    
     return {
         "success": True,
         "message": "Customer registered successfully",
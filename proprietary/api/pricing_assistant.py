@@ -5,9 +5,11 @@ Provides AI-driven pricing support and automated discounts.
 """
 
 from fastapi import APIRouter, HTTPException, Header, Request, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
+import json
 import os
 import logging
 import uuid
@@ -15,14 +17,12 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..ai.claude_pricing_agent import PricingAgent, ConversationManager
+from ..ai.response_cache import PricingResponseCache
 from ..database.models import Customer, Request as DBRequest
 from ..auth.api_key import verify_api_key
 
 logger = logging.getLogger(__name__)
 
-# Initialize conversation manager
-conversation_manager = ConversationManager()
-
 # Create router
 router = APIRouter(
     prefix="/api/v1/pricing",
@@ -89,16 +89,16 @@ async def get_customer_data(
     }
 
 
-@router.post("/assistant", response_model=PricingResponse)
-async def pricing_assistant(
+async def _prepare_assistant(
     query: PricingQuery,
     request: Request,
-    api_key: str = Header(None, alias="X-API-Key")
-):
+    api_key: Optional[str]
+) -> Tuple[Dict[str, Any], str, List[Dict], PricingAgent]:
     """
-    AI-powered pricing assistant endpoint.
+    Resolve the customer, session and agent for an assistant query.
     
-    Handles pricing questions, applies discounts, and creates payment links.
+    Returns:
+        Tuple of (customer_data, session_id, conversation_history, agent)
     """
     db = request.state.db
     
@@ -124,7 +124,7 @@ async def pricing_assistant(
     session_id = query.session_id or str(uuid.uuid4())
     
     # Get conversation history
-    conversation_history = conversation_manager.get_conversation(session_id)
+    conversation_history = await ConversationManager(request.state.redis).get_conversation(session_id)
     
     # Initialize Claude agent
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
@@ -134,7 +134,29 @@ async def pricing_assistant(
             detail="AI assistant not configured"
         )
     
-    agent = PricingAgent(anthropic_key, agent_type=query.agent_type)
+    agent = PricingAgent(
+        anthropic_key,
+        agent_type=query.agent_type,
+        cache=PricingResponseCache(request.state.redis)
+    )
+    
+    return customer_data, session_id, conversation_history, agent
+
+
+@router.post("/assistant", response_model=PricingResponse)
+async def pricing_assistant(
+    query: PricingQuery,
+    request: Request,
+    api_key: str = Header(None, alias="X-API-Key")
+):
+    """
+    AI-powered pricing assistant endpoint.
+    
+    Handles pricing questions, applies discounts, and creates payment links.
+    """
+    customer_data, session_id, conversation_history, agent = await _prepare_assistant(
+        query, request, api_key
+    )
     
     try:
         # Process the query
@@ -145,8 +167,9 @@ async def pricing_assistant(
         )
         
         # Update conversation history
-        conversation_manager.add_message(session_id, "user", query.query)
-        conversation_manager.add_message(session_id, "assistant", result["response"])
+        conversation_manager = ConversationManager(request.state.redis)
+        await conversation_manager.add_message(session_id, "user", query.query)
+        await conversation_manager.add_message(session_id, "assistant", result["response"])
         
         # Log the interaction
         logger.info(f"Pricing assistant query from {customer_data.get('email', 'anonymous')}: {query.query[:50]}...")
@@ -169,6 +192,55 @@ async def pricing_assistant(
         )
 
 
+@router.post("/chat")
+async def pricing_chat(
+    query: PricingQuery,
+    request: Request,
+    api_key: str = Header(None, alias="X-API-Key")
+):
+    """
+    Streaming version of the pricing assistant.
+    
+    Sends the response as server-sent events while Claude writes it: one
+    `data` event per text chunk, then a `done` event carrying the session ID,
+    any actions taken and the error, if there was one.
+    """
+    customer_data, session_id, conversation_history, agent = await _prepare_assistant(
+        query, request, api_key
+    )
+    
+    async def events():
+        result = {}
+        async for text in agent.stream_pricing_request(
+            customer_query=query.query,
+            customer_data=customer_data,
+            conversation_history=conversation_history,
+            result=result
+        ):
+            yield f"data: {json.dumps({'text': text})}\n\n"
+            
+        # Update conversation history
+        conversation_manager = ConversationManager(request.state.redis)
+        await conversation_manager.add_message(session_id, "user", query.query)
+        await conversation_manager.add_message(session_id, "assistant", result["response"])
+        
+        logger.info(f"Pricing chat query from {customer_data.get('email', 'anonymous')}: {query.query[:50]}...")
+        
+        done = {
+            "success": result["success"],
+            "session_id": session_id,
+            "actions": result.get("actions"),
+            "error": result.get("error")
+        }
+        yield f"event: done\ndata: {json.dumps(done, default=str)}\n\n"
+        
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/check-discount-eligibility")
 async def check_discount_eligibility(
     request: Request,
@@ -222,10 +294,11 @@ async def check_discount_eligibility(
 @router.post("/clear-conversation")
 async def clear_conversation(
     session_id: str,
+    request: Request,
     api_key: str = Header(None, alias="X-API-Key")
 ):
     """Clear conversation history for a session."""
-    conversation_manager.clear_conversation(session_id)
+    await ConversationManager(request.state.redis).clear_conversation(session_id)
     return {"success": True, "message": "Conversation cleared"}
 
 
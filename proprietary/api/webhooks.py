@@ -18,6 +18,7 @@ import stripe
 
 from ..database.models import Customer, Request as DBRequest, RequestEvent, RequestStatus, CreditPurchase
 from ..billing.stripe_handler import StripeHandler
+from ..ai.response_cache import PricingResponseCache
 from core.scrapers.phoenix_pd import PhoenixPDScraper
 from ..integrations.stripe_tools import update_volume_pricing, apply_retroactive_discount
 
@@ -106,6 +107,26 @@ async def process_request_immediately(
                 
                 # TODO: Send success email to customer
                 
+            elif result and result.get("status") == "unknown":
+                # The portal may already have this request: park it for
+                # manual review instead of retrying and filing it twice.
+                # The worker only picks up PAYMENT_RECEIVED requests.
+                request.status = RequestStatus.SUBMITTING
+                request.internal_notes = f"Manual review: {result.get('error')}"
+                
+                log_entry = RequestEvent(
+                    request_id=request.id,
+                    event_type="submission_needs_review",
+                    event_data={
+                        "details": "Portal outcome unknown, check before resubmitting",
+                        "error": result.get("error")
+                    },
+                    triggered_by="webhook"
+                )
+                db.add(log_entry)
+                
+                logger.error(f"Submission of request {request_id} needs manual review")
+                
             else:
                 # Failed - but don't refund yet, will retry
                 request.status = RequestStatus.PAYMENT_RECEIVED
@@ -314,6 +335,11 @@ async def stripe_webhook(
                         if pricing_result.get("success"):
                             logger.info(f"Updated customer to {pricing_result['tier_name']} tier")
                             
+                            # Cached assistant answers quote the old pricing
+                            await PricingResponseCache(request.state.redis).invalidate_customer(
+                                customer.stripe_customer_id
+                            )
+                            
                             # Check for retroactive discount
                             if usage_count in [11, 51, 100]:
                                 credit_result = apply_retroactive_discount(
@@ -2,8 +2,20 @@
 API key authentication utilities.
 """
 
+import logging
+from typing import Optional, Tuple
+
+import orjson
 from fastapi import HTTPException, Header
-from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database.models import Customer
+
+logger = logging.getLogger(__name__)
+
+# Seconds a resolved API key stays cached in Redis
+API_KEY_CACHE_TTL = 300
 
 
 async def verify_api_key(
@@ -35,4 +47,51 @@ async def verify_api_key(
             detail="Invalid API key"
         )
         
-    return api_key
\ No newline at end of file
+    return api_key
+
+
+async def lookup_api_key(
+    api_key: str,
+    db: AsyncSession,
+    redis=None
+) -> Optional[Tuple[int, str]]:
+    """
+    Resolve an API key to its customer, checking Redis before the database.
+    
+    Only hits are cached, so a key issued after a miss works immediately.
+    
+    Args:
+        api_key: API key to resolve
+        db: Database session
+        redis: redis.asyncio client, or None to always query the database
+        
+    Returns:
+        Tuple of (customer_id, email), or None if no customer has the key
+    """
+    key = f"apikey:{api_key}"
+    
+    if redis is not None:
+        try:
+            cached = await redis.get(key)
+        except Exception as e:
+            logger.warning(f"API key cache lookup failed: {e}")
+            cached = None
+        
+        if cached is not None:
+            customer_id, email = orjson.loads(cached)
+            return customer_id, email
+    
+    result = await db.execute(
+        select(Customer.id, Customer.email).where(Customer.api_key == api_key)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    
+    if redis is not None:
+        try:
+            await redis.setex(key, API_KEY_CACHE_TTL, orjson.dumps([row.id, row.email]))
+        except Exception as e:
+            logger.warning(f"API key cache store failed: {e}")
+    
+    return row.id, row.email
@@ -0,0 +1,102 @@
+"""
+Endpoint tests for /pricing revalidation and the customer upsert.
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from proprietary.api.endpoints import _upsert_customer, router
+from proprietary.database.models import Base, Customer, PricingTier
+
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_pricing_serves_body_with_etag():
+    response = client.get("/api/v1/pricing")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert response.headers["etag"].startswith('"')
+    
+    pricing = response.json()
+    assert pricing["base_price"] == 49.0
+    assert pricing["volume_discounts"]["11-50"] == {"discount": "20%", "price": 39.2}
+    assert [package["credits"] for package in pricing["prepaid_packages"]] == [12, 60, 200]
+    assert pricing["phoenix_pd_fees"]["recordings_911"] == 16.5
+
+
+def test_pricing_not_modified_for_matching_etag():
+    etag = client.get("/api/v1/pricing").headers["etag"]
+    
+    for if_none_match in (etag, f"W/{etag}", f'"stale", {etag}'):
+        response = client.get("/api/v1/pricing", headers={"If-None-Match": if_none_match})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+
+def test_pricing_served_for_stale_etag():
+    response = client.get("/api/v1/pricing", headers={"If-None-Match": '"stale"'})
+    
+    assert response.status_code == 200
+    assert response.json()["currency"] == "USD"
+
+
+async def upsert_twice(first, second):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    try:
+        async with session() as db:
+            created = await _upsert_customer(db, **first)
+            await db.commit()
+            
+        async with session() as db:
+            existing = await _upsert_customer(db, **second)
+            await db.commit()
+            count = await db.scalar(select(func.count()).select_from(Customer))
+    finally:
+        await engine.dispose()
+        
+    return created, existing, count
+
+
+def test_upsert_customer_inserts_then_returns_existing():
+    created, existing, count = asyncio.run(upsert_twice(
+        dict(email="a@example.com", first_name="Ann", tier=PricingTier.STANDARD, credits_balance=0),
+        dict(email="a@example.com", first_name="Bob", api_key="key", tier=PricingTier.VOLUME)
+    ))
+    
+    # Insert path: the new row comes back with its generated columns
+    assert created.id is not None
+    assert created.first_name == "Ann"
+    assert created.created_at is not None
+    
+    # Conflict path: same row, and the new values are not applied
+    assert existing.id == created.id
+    assert existing.first_name == "Ann"
+    assert existing.api_key is None
+    assert existing.tier == PricingTier.STANDARD
+    assert count == 1
+
+
+def test_upsert_customer_keeps_distinct_emails_apart():
+    first, second, count = asyncio.run(upsert_twice(
+        dict(email="a@example.com", first_name="Ann"),
+        dict(email="b@example.com", first_name="Bob")
+    ))
+    
+    assert first.id != second.id
+    assert second.first_name == "Bob"
+    assert count == 2
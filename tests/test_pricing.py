@@ -0,0 +1,123 @@
+"""
+Volume pricing pinned to what the original Decimal implementation returned.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from core.utils.pricing import (
+    calculate_monthly_savings,
+    calculate_order_total,
+    format_price_message,
+    get_best_package_for_quantity,
+    get_credit_packages,
+    get_volume_discount
+)
+
+
+@pytest.mark.parametrize("quantity, expected", [
+    (0, (0, Decimal("49.00"))),
+    (10, (0, Decimal("49.00"))),
+    (11, (20, Decimal("39.20"))),
+    (50, (20, Decimal("39.20"))),
+    (51, (40, Decimal("29.40"))),
+    (200, (40, Decimal("29.40"))),
+])
+def test_get_volume_discount(quantity, expected):
+    assert get_volume_discount(quantity) == expected
+
+
+@pytest.mark.parametrize("quantity, include_pd_fee, expected", [
+    (1, False, ("49.00", 0, "49.00", "0.00", "49.00", "0.00", "49.00")),
+    (10, True, ("49.00", 0, "490.00", "50.00", "540.00", "0.00", "490.00")),
+    (11, True, ("39.20", 20, "431.20", "55.00", "486.20", "107.80", "539.00")),
+    (51, False, ("29.40", 40, "1499.40", "0.00", "1499.40", "999.60", "2499.00")),
+    (100, True, ("29.40", 40, "2940.00", "500.00", "3440.00", "1960.00", "4900.00")),
+])
+def test_calculate_order_total(quantity, include_pd_fee, expected):
+    pricing = calculate_order_total(quantity, include_pd_fee=include_pd_fee)
+    
+    assert pricing.pop("quantity") == quantity
+    # str() also pins the two-place exponent, which == on Decimal ignores
+    assert tuple(
+        value if isinstance(value, int) else str(value)
+        for value in pricing.values()
+    ) == expected
+
+
+@pytest.mark.parametrize("quantity, pd_fee, expected", [
+    (3, Decimal("2.505"), "7.52"),
+    (1, Decimal("0.125"), "0.12"),
+    (7, Decimal("5"), "35.00"),
+])
+def test_calculate_order_total_rounds_fee_total(quantity, pd_fee, expected):
+    pricing = calculate_order_total(quantity, include_pd_fee=True, pd_fee=pd_fee)
+    
+    assert str(pricing["pd_fees"]) == expected
+    assert pricing["total"] == pricing["subtotal"] + pricing["pd_fees"]
+
+
+def test_calculate_order_total_returns_a_fresh_dict():
+    calculate_order_total(12)["name"] = "Starter"
+    
+    assert "name" not in calculate_order_total(12)
+
+
+def test_get_credit_packages():
+    packages = get_credit_packages()
+    
+    assert [(p["name"], p["quantity"], str(p["total"])) for p in packages] == [
+        ("Starter", 12, "470.40"),
+        ("Professional", 60, "1764.00"),
+        ("Enterprise", 200, "5880.00"),
+    ]
+    
+    packages[0]["total"] = Decimal("0")
+    assert get_credit_packages()[0]["total"] == Decimal("470.40")
+
+
+@pytest.mark.parametrize("quantity, name", [
+    (5, "Starter"),
+    (12, "Starter"),
+    (13, "Professional"),
+    (61, "Enterprise"),
+    (500, None),
+])
+def test_get_best_package_for_quantity(quantity, name):
+    package = get_best_package_for_quantity(quantity)
+    
+    assert package.get("name") == name
+    assert package["quantity"] >= quantity
+
+
+def test_calculate_monthly_savings():
+    assert calculate_monthly_savings(25) == {
+        "reports_per_month": 25,
+        "monthly_cost_no_discount": Decimal("1225.00"),
+        "monthly_cost_with_discount": Decimal("980.00"),
+        "monthly_savings": Decimal("245.00"),
+        "annual_reports": 300,
+        "annual_cost_no_discount": Decimal("14700.00"),
+        "annual_cost_with_discount": Decimal("8820.00"),
+        "annual_savings": Decimal("5880.00")
+    }
+
+
+@pytest.mark.parametrize("quantity, expected", [
+    (1, (
+        "Pricing for 1 reports:\n"
+        "- Service fee: $49.00 each\n"
+        "- Phoenix PD fee: $5.00 each\n"
+        "- Total per report: $54.00\n"
+    )),
+    (20, (
+        "Pricing for 20 reports:\n"
+        "- Service fee: $39.20 each (20% discount)\n"
+        "- Phoenix PD fee: $5.00 each\n"
+        "- Total per report: $44.20\n"
+        "\nTotal cost: $884.00 (You save $196.00!)"
+    )),
+])
+def test_format_price_message(quantity, expected):
+    assert format_price_message(quantity) == expected
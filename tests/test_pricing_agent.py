@@ -0,0 +1,129 @@
+"""
+Smoke tests for the pricing agent's streaming path against a stubbed client.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from proprietary.ai.claude_pricing_agent import PricingAgent
+
+
+class StubModel:
+    """Just enough of the SDK's pydantic models for the agent."""
+    
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+    
+    def model_copy(self, update=None):
+        return StubModel(**{**self.__dict__, **(update or {})})
+    
+    def model_dump(self):
+        return {
+            key: value.model_dump() if isinstance(value, StubModel) else value
+            for key, value in self.__dict__.items()
+        }
+
+
+def event(type, **fields):
+    return SimpleNamespace(type=type, **fields)
+
+
+def text_turn(*parts):
+    return [
+        event("message_start", message=StubModel(role="assistant", content=[], stop_reason=None)),
+        event("content_block_start", index=0, content_block=StubModel(type="text", text="")),
+        *(
+            event("content_block_delta", index=0, delta=SimpleNamespace(type="text_delta", text=part))
+            for part in parts
+        ),
+        event("content_block_stop", index=0),
+        event("message_delta", delta=SimpleNamespace(stop_reason="end_turn")),
+        event("message_stop")
+    ]
+
+
+def tool_turn():
+    tool_block = StubModel(type="tool_use", id="toolu_1", name="calculate_savings", input={})
+    return [
+        event("message_start", message=StubModel(role="assistant", content=[], stop_reason=None)),
+        event("content_block_start", index=0, content_block=tool_block),
+        event("content_block_delta", index=0, delta=SimpleNamespace(
+            type="input_json_delta", partial_json='{"monthly_'
+        )),
+        event("content_block_delta", index=0, delta=SimpleNamespace(
+            type="input_json_delta", partial_json='usage": 25}'
+        )),
+        event("content_block_stop", index=0),
+        event("message_delta", delta=SimpleNamespace(stop_reason="tool_use")),
+        event("message_stop")
+    ]
+
+
+class StubMessages:
+    """Replays canned event streams for messages.create(stream=True)."""
+    
+    def __init__(self, *turns):
+        self.turns = list(turns)
+        self.calls = []
+    
+    async def create(self, **params):
+        self.calls.append(params)
+        assert params.get("stream") is True
+        events = self.turns.pop(0)
+        
+        async def stream():
+            for item in events:
+                yield item
+        
+        return stream()
+
+
+def make_agent(*turns):
+    agent = PricingAgent(api_key="test-key")
+    messages = StubMessages(*turns)
+    agent.client = SimpleNamespace(beta=SimpleNamespace(messages=messages))
+    return agent, messages
+
+
+async def collect(agent, result):
+    return [
+        chunk async for chunk in agent.stream_pricing_request(
+            "How much for 25 reports?",
+            {"monthly_usage": 25},
+            result=result
+        )
+    ]
+
+
+def test_stream_yields_text_deltas():
+    agent, messages = make_agent(text_turn("Each report ", "costs $49."))
+    result = {}
+    
+    chunks = asyncio.run(collect(agent, result))
+    
+    assert chunks == ["Each report ", "costs $49."]
+    assert result["success"] is True
+    assert result["response"] == "Each report costs $49."
+    assert len(messages.calls) == 1
+
+
+def test_stream_runs_tools_between_turns():
+    agent, messages = make_agent(tool_turn(), text_turn("You'd save $200."))
+    tool_calls = []
+    
+    async def execute_tool(tool_name, tool_input, customer_data):
+        tool_calls.append((tool_name, tool_input))
+        return {"savings": 200}
+    
+    agent._execute_tool = execute_tool
+    result = {}
+    
+    chunks = asyncio.run(collect(agent, result))
+    
+    assert chunks == ["You'd save $200."]
+    assert result["success"] is True
+    assert tool_calls == [("calculate_savings", {"monthly_usage": 25})]
+    
+    followup = messages.calls[1]["messages"][-2:]
+    assert followup[0]["content"][0]["input"] == {"monthly_usage": 25}
+    assert followup[1]["content"][0]["tool_use_id"] == "toolu_1"
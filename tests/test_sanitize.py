@@ -0,0 +1,101 @@
+"""
+Sanitizer outputs pinned to what the original implementation returned.
+"""
+
+import pytest
+
+from core.utils.sanitize import (
+    sanitize_case_number,
+    sanitize_email,
+    sanitize_phoenix_input,
+    sanitize_phone,
+    sanitize_requestor_info
+)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ('  a <b> & c # d "q"\n\r\tx  ', "a (b) and c number d 'q' x"),
+    ("José Ñoño", "José Ñoño"),
+    ("a\x00b\x07c\x0bd\x0ce\xa0f g", "abcdef g"),
+    ("emoji \U0001F600 ok", "emoji \U0001F600 ok"),
+    ("\u200bzero\xadwidth", "zerowidth"),
+    ("", ""),
+    (123, "123"),
+    (["a", "<b>"], "['a', '(b)']"),
+])
+def test_sanitize_phoenix_input(raw, expected):
+    assert sanitize_phoenix_input(raw) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("2024-123", "2024-123"),
+    ("ab#12 3", "AB123"),
+    ("ÄB12", "B12"),
+    (2024, "2024"),
+])
+def test_sanitize_case_number(raw, expected):
+    assert sanitize_case_number(raw) == expected
+
+
+@pytest.mark.parametrize("raw, message", [
+    ("", "Case number cannot be empty"),
+    ("###", "Case number '###' contains no valid characters"),
+])
+def test_sanitize_case_number_rejects(raw, message):
+    with pytest.raises(ValueError, match=message):
+        sanitize_case_number(raw)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("  A.B+c@d-e.org", "a.b+c@d-e.org"),
+    ("a<b>@x.io", "ab@x.io"),
+    ("", ""),
+])
+def test_sanitize_email(raw, expected):
+    assert sanitize_email(raw) == expected
+
+
+def test_sanitize_email_rejects():
+    with pytest.raises(ValueError, match="Invalid email format: bad"):
+        sanitize_email("bad")
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("602-555-1234", "6025551234"),
+    ("1 (602) 555 1234", "6025551234"),
+    ("16025551234", "6025551234"),
+    ("6025551234", "6025551234"),
+    (6025551234, "6025551234"),
+    ("٦٠٢٥٥٥١٢٣٤",
+     "٦٠٢٥٥٥١٢٣٤"),
+    ("", ""),
+])
+def test_sanitize_phone(raw, expected):
+    assert sanitize_phone(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["5551234", "21234567890"])
+def test_sanitize_phone_rejects(raw):
+    with pytest.raises(ValueError, match=f"Invalid phone number length: {raw}"):
+        sanitize_phone(raw)
+
+
+def test_sanitize_requestor_info():
+    info = {
+        "first_name": "A&B",
+        "last_name": "<x>",
+        "email": "A@B.com",
+        "phone": "602 555 1234",
+        "company": "C#1",
+        "address": "1 Main\nSt",
+        "other": "z"
+    }
+    
+    assert sanitize_requestor_info(info) == {
+        "first_name": "AandB",
+        "last_name": "(x)",
+        "email": "a@b.com",
+        "phone": "6025551234",
+        "company": "Cnumber1",
+        "address": "1 Main St"
+    }
@@ -64,6 +64,8 @@ class RequestProcessor:
         
     async def cleanup(self):
         """Clean up connections."""
+        # Close pooled browser contexts and the shared browser
+        await PhoenixPDScraper.close_pool()
         if self.redis_client:
             await self.redis_client.close()
         if self.engine:
@@ -127,6 +129,23 @@ class RequestProcessor:
                     # Send notification email (TODO: implement email service)
                     # await send_submission_notification(request)
                     
+                elif result and result.get("status") == "unknown":
+                    # The portal may already have this request: park it for
+                    # manual review rather than retrying and filing it twice
+                    request.status = RequestStatus.SUBMITTING
+                    request.internal_notes = f"Manual review: {result.get('error')}"
+                    
+                    log_entry = RequestLog(
+                        request_id=request.id,
+                        action="submission_needs_review",
+                        details="Portal outcome unknown, check before resubmitting",
+                        is_error=True,
+                        error_message=result.get("error")
+                    )
+                    session.add(log_entry)
+                    
+                    logger.error(f"Request {request.id} needs manual review")
+                    
                 else:
                     # Submission failed
                     request.retry_count += 1